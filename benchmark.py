@@ -0,0 +1,493 @@
+"""
+Benchmark: End-to-end loader run on synthetic meter data
+
+Generates a reproducible meter-data source of configurable size and loads it
+with GenericDataLoader into a local stand-in of the production stack:
+- Source: a local DuckDB file (default) or the PostgreSQL from SOURCE_* env
+- Storage: a local directory (default) or any s3:// root (e.g. MinIO)
+- Catalog: a SQLite-backed pyiceberg SQL catalog
+
+An initial load is followed by an incremental load of newly generated
+readings. Rows/s, bytes written, file counts and per-stage timings are
+reported as JSON, so regressions show up as differences between runs.
+
+Usage:
+    python benchmark.py --customers 10000 --readings 10000000 --output result.json
+
+Source engines are compared on PostgreSQL by running once per engine:
+    python benchmark.py --source postgres --source-engine scanner --output scanner.json
+    python benchmark.py --source postgres --source-engine binary_copy --output binary_copy.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import duckdb
+import pyarrow
+import pyiceberg
+
+from load_data_generic import (
+    DatabaseConfig,
+    DataSourceInterface,
+    PostgreSQLDataSource,
+    GenericDataLoader,
+    create_data_source,
+    IcebergTableManager,
+    ConfigLoader,
+    TableLoadResult,
+    create_meter_data_definitions
+)
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Readings are 15 minute intervals per asset
+INTERVAL_MINUTES = 15
+
+# First reading interval of a generated source
+DEFAULT_START = "2024-01-01 00:00:00"
+
+
+# ============================================================================
+# Local Data Source
+# ============================================================================
+
+class DuckDBDataSource(DataSourceInterface):
+    """Local DuckDB database file standing in for the PostgreSQL source"""
+
+    def __init__(self, config: DatabaseConfig, database_path: str):
+        self.config = config
+        self.database_path = database_path
+        self.connection = None
+
+    def connect(self) -> duckdb.DuckDBPyConnection:
+        """Attach the DuckDB file read-only as the source catalog"""
+        self.connection = self.create_isolated_connection()
+        return self.connection
+
+    def create_isolated_connection(self) -> duckdb.DuckDBPyConnection:
+        """Open a new in-memory DuckDB database with the source file attached"""
+        connection = duckdb.connect(":memory:")
+        connection.execute(f"ATTACH '{self.get_connection_string()}' AS raw (READ_ONLY);")
+        connection.execute("USE raw;")
+
+        # S3-compatible storage root (e.g. local MinIO)
+        if self.config.storage_root.startswith("s3://"):
+            connection.execute("INSTALL httpfs; LOAD httpfs;")
+            connection.execute(f"""
+                SET s3_region='{self.config.s3_region}';
+                SET s3_access_key_id='{self.config.s3_access_key}';
+                SET s3_secret_access_key='{self.config.s3_secret_key}';
+                SET s3_endpoint='{self.config.s3_endpoint}';
+                SET s3_url_style='path';
+                SET s3_use_ssl=false;
+            """)
+
+        return connection
+
+    def disconnect(self) -> None:
+        """Close connection"""
+        if self.connection:
+            self.connection.close()
+
+    def create_worker_connection(self, connection) -> duckdb.DuckDBPyConnection:
+        """Open a cursor on the shared DuckDB database with the source selected"""
+        cursor = connection.cursor()
+        cursor.execute("USE raw;")
+        return cursor
+
+    def get_scanner_extension(self) -> str:
+        return "duckdb"
+
+    def get_connection_string(self) -> str:
+        return self.database_path
+
+
+# ============================================================================
+# Synthetic Data Generator
+# ============================================================================
+
+def _uniform(seed: int, key: str, salt: str) -> str:
+    """Deterministic pseudo-random value in [0, 1) for a row key"""
+    return f"((hash({key}, {seed}, '{salt}') % 1000000) / 1000000.0)"
+
+
+def generate_dimensions(
+    connection,
+    customers: int,
+    accounts_per_customer: int,
+    assets_per_account: int,
+    seed: int
+) -> None:
+    """Create the meter_data schema with customers, accounts and assets"""
+    connection.execute("CREATE SCHEMA IF NOT EXISTS meter_data;")
+    u = lambda key, salt: _uniform(seed, key, salt)
+
+    connection.execute(f"""
+        CREATE OR REPLACE TABLE meter_data.customers AS
+        SELECT
+            'INST' || lpad(CAST(i AS VARCHAR), 9, '0') AS installation_id,
+            'Customer ' || i AS customer_name,
+            ['RESIDENTIAL', 'RESIDENTIAL', 'RESIDENTIAL', 'COMMERCIAL', 'INDUSTRIAL'][
+                1 + CAST(floor({u('i', 'type')} * 5) AS INTEGER)] AS customer_type,
+            CAST(1 + i % 999 AS VARCHAR) || ' Main Street' AS address,
+            ['Springfield', 'Riverside', 'Fairview', 'Greenville', 'Madison'][1 + i % 5] AS city,
+            lpad(CAST(10000 + i % 89999 AS VARCHAR), 5, '0') AS postal_code,
+            'USA' AS country,
+            TIMESTAMP '{DEFAULT_START}' - INTERVAL 1 DAY * CAST(floor({u('i', 'reg')} * 3650) AS INTEGER)
+                AS registration_date,
+            TIMESTAMP '{DEFAULT_START}' - INTERVAL 1 SECOND * CAST(floor({u('i', 'mod')} * 86400) AS INTEGER)
+                AS last_modified,
+            CASE WHEN {u('i', 'status')} < 0.97 THEN 'ACTIVE' ELSE 'INACTIVE' END AS status
+        FROM range({customers}) t(i)
+    """)
+
+    connection.execute(f"""
+        CREATE OR REPLACE TABLE meter_data.customer_accounts AS
+        SELECT
+            'ACC' || lpad(CAST(i AS VARCHAR), 9, '0') AS account_id,
+            'INST' || lpad(CAST(i // {accounts_per_customer} AS VARCHAR), 9, '0') AS installation_id,
+            'AN-' || lpad(CAST(i AS VARCHAR), 10, '0') AS account_number,
+            CASE WHEN {u('i', 'acct')} < 0.8 THEN 'POSTPAID' ELSE 'PREPAID' END AS account_type,
+            CASE WHEN {u('i', 'cycle')} < 0.9 THEN 'MONTHLY' ELSE 'QUARTERLY' END AS billing_cycle,
+            TIMESTAMP '{DEFAULT_START}' - INTERVAL 1 DAY * CAST(floor({u('i', 'open')} * 3000) AS INTEGER)
+                AS account_opened_date,
+            CAST(NULL AS TIMESTAMP) AS account_closed_date,
+            TIMESTAMP '{DEFAULT_START}' - INTERVAL 1 SECOND * CAST(floor({u('i', 'mod')} * 86400) AS INTEGER)
+                AS last_modified,
+            'ACTIVE' AS status
+        FROM range({customers * accounts_per_customer}) t(i)
+    """)
+
+    connection.execute(f"""
+        CREATE OR REPLACE TABLE meter_data.assets AS
+        SELECT
+            'MTR' || lpad(CAST(i AS VARCHAR), 9, '0') AS asset_id,
+            'ACC' || lpad(CAST(i // {assets_per_account} AS VARCHAR), 9, '0') AS account_id,
+            'SN-' || lpad(CAST(i AS VARCHAR), 10, '0') AS asset_serial_number,
+            ['ELECTRIC', 'ELECTRIC', 'GAS', 'WATER'][1 + i % 4] AS asset_type,
+            ['Landis+Gyr', 'Itron', 'Siemens', 'Kamstrup'][1 + CAST(floor({u('i', 'mfr')} * 4) AS INTEGER)]
+                AS manufacturer,
+            'M' || CAST(100 + i % 7 AS VARCHAR) AS model,
+            TIMESTAMP '{DEFAULT_START}' - INTERVAL 1 DAY * CAST(floor({u('i', 'inst')} * 2000) AS INTEGER)
+                AS installation_date,
+            TIMESTAMP '{DEFAULT_START}' - INTERVAL 1 DAY * CAST(floor({u('i', 'cal')} * 365) AS INTEGER)
+                AS last_calibration_date,
+            TIMESTAMP '{DEFAULT_START}' + INTERVAL 1 DAY * CAST(floor({u('i', 'cal')} * 365) AS INTEGER)
+                AS next_calibration_date,
+            TIMESTAMP '{DEFAULT_START}' - INTERVAL 1 SECOND * CAST(floor({u('i', 'mod')} * 86400) AS INTEGER)
+                AS last_modified,
+            CASE WHEN {u('i', 'status')} < 0.98 THEN 'ACTIVE' ELSE 'INACTIVE' END AS status
+        FROM range({customers * accounts_per_customer * assets_per_account}) t(i)
+    """)
+
+
+def generate_readings(connection, count: int, seed: int) -> None:
+    """Append count readings to meter_data.readings
+
+    Readings walk the assets round-robin through consecutive 15 minute
+    intervals. creation_time is interval_end plus a transmission delay: a
+    few minutes to an hour for most rows and up to two days for a late 3%.
+    Appended batches start after the newest creation_time already present,
+    so an incremental load sees every new row.
+    """
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS meter_data.readings (
+            id INTEGER,
+            asset_id VARCHAR,
+            reading_value DECIMAL(15, 3),
+            interval_start TIMESTAMP,
+            interval_end TIMESTAMP,
+            creation_time TIMESTAMP,
+            reading_type VARCHAR,
+            unit_of_measure VARCHAR,
+            quality_code VARCHAR,
+            status VARCHAR,
+            source_system VARCHAR
+        )
+    """)
+    first_id, start = connection.execute(f"""
+        SELECT
+            coalesce(max(id), 0) + 1,
+            coalesce(
+                time_bucket(INTERVAL {INTERVAL_MINUTES} MINUTE, max(creation_time))
+                    + INTERVAL {INTERVAL_MINUTES} MINUTE,
+                TIMESTAMP '{DEFAULT_START}'
+            )
+        FROM meter_data.readings
+    """).fetchone()
+    assets = connection.execute("SELECT count(*) FROM meter_data.assets").fetchone()[0]
+    u = lambda salt: _uniform(seed, "id", salt)
+
+    connection.execute(f"""
+        INSERT INTO meter_data.readings
+        WITH numbered AS (
+            SELECT
+                i + {first_id} AS id,
+                i % {assets} AS asset_index,
+                TIMESTAMP '{start}' + INTERVAL {INTERVAL_MINUTES} MINUTE * CAST(i // {assets} AS BIGINT)
+                    AS interval_start
+            FROM range({count}) t(i)
+        )
+        SELECT
+            id,
+            'MTR' || lpad(CAST(asset_index AS VARCHAR), 9, '0') AS asset_id,
+            CAST(round(0.05 + {u('value')} * 2.5, 3) AS DECIMAL(15, 3)) AS reading_value,
+            interval_start,
+            interval_start + INTERVAL {INTERVAL_MINUTES} MINUTE AS interval_end,
+            interval_start + INTERVAL {INTERVAL_MINUTES} MINUTE + CASE
+                WHEN {u('late')} < 0.97
+                    THEN INTERVAL 1 SECOND * CAST(60 + floor({u('delay')} * 3540) AS INTEGER)
+                ELSE INTERVAL 1 SECOND * CAST(3600 + floor({u('delay')} * 169200) AS INTEGER)
+            END AS creation_time,
+            CASE WHEN {u('type')} < 0.9 THEN 'CONSUMPTION' ELSE 'DEMAND' END AS reading_type,
+            ['kWh', 'kWh', 'm³', 'L'][1 + asset_index % 4] AS unit_of_measure,
+            CASE WHEN {u('quality')} < 0.98 THEN 'GOOD' ELSE 'SUSPECT' END AS quality_code,
+            CASE WHEN {u('status')} < 0.95 THEN 'VALID' ELSE 'ESTIMATED' END AS status,
+            'METER_SYSTEM' AS source_system
+        FROM numbered
+    """)
+
+
+def copy_to_postgres(database_path: str, config: DatabaseConfig) -> None:
+    """Replace the meter_data tables in the configured PostgreSQL source"""
+    source = PostgreSQLDataSource(config)
+    connection = duckdb.connect(":memory:")
+    try:
+        connection.execute("INSTALL postgres_scanner; LOAD postgres_scanner;")
+        connection.execute(f"ATTACH '{database_path}' AS gen (READ_ONLY);")
+        connection.execute(f"ATTACH '{source.get_connection_string()}' AS pg (TYPE postgres);")
+        connection.execute(f"CREATE SCHEMA IF NOT EXISTS pg.{config.source_schema};")
+        for table in ("customers", "customer_accounts", "assets", "readings"):
+            connection.execute(f"DROP TABLE IF EXISTS pg.{config.source_schema}.{table};")
+            connection.execute(f"""
+                CREATE TABLE pg.{config.source_schema}.{table} AS
+                SELECT * FROM gen.meter_data.{table}
+            """)
+    finally:
+        connection.close()
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+def table_totals(table_manager: IcebergTableManager, table_name: str) -> Dict[str, int]:
+    """Record, file and byte totals from the table's current snapshot summary"""
+    try:
+        table = table_manager._get_catalog().load_table(
+            (table_manager.config.iceberg_namespace, table_name)
+        )
+    except Exception:
+        return {"records": 0, "data_files": 0, "bytes": 0}
+
+    snapshot = table.current_snapshot()
+    summary = snapshot.summary if snapshot else {}
+    return {
+        "records": int(summary.get("total-records", 0)),
+        "data_files": int(summary.get("total-data-files", 0)),
+        "bytes": int(summary.get("total-files-size", 0)),
+    }
+
+
+def run_load_stage(
+    name: str,
+    loader: GenericDataLoader,
+) -> Dict[str, Any]:
+    """Run load_all_tables and measure what it added to each table"""
+    table_names = [t.name for t in loader.table_definitions]
+    before = {t: table_totals(loader.table_manager, t) for t in table_names}
+
+    started = time.monotonic()
+    results: List[TableLoadResult] = loader.load_all_tables()
+    seconds = time.monotonic() - started
+
+    tables = {}
+    for result in results:
+        after = table_totals(loader.table_manager, result.table_name)
+        delta = {k: after[k] - before[result.table_name][k] for k in after}
+        tables[result.table_name] = {
+            "success": result.success,
+            "error": result.error,
+            "seconds": round(result.duration_seconds, 3),
+            "rows": delta["records"],
+            "rows_per_second": round(delta["records"] / result.duration_seconds, 1)
+            if result.duration_seconds else None,
+            "bytes_written": max(delta["bytes"], 0),
+            "data_files_added": delta["data_files"],
+            "total_data_files": after["data_files"],
+            "stages": [m.to_dict() for m in result.stages],
+        }
+
+    rows = sum(t["rows"] for t in tables.values())
+    return {
+        "name": name,
+        "run_id": loader.table_manager.metrics.run_id,
+        "seconds": round(seconds, 3),
+        "rows": rows,
+        "rows_per_second": round(rows / seconds, 1) if seconds else None,
+        "bytes_written": sum(t["bytes_written"] for t in tables.values()),
+        "data_files_added": sum(t["data_files_added"] for t in tables.values()),
+        "success": all(t["success"] for t in tables.values()),
+        "tables": tables,
+    }
+
+
+def timed_stage(name: str, func, *args) -> Dict[str, Any]:
+    """Run a non-load stage and record its duration"""
+    started = time.monotonic()
+    func(*args)
+    return {"name": name, "seconds": round(time.monotonic() - started, 3)}
+
+
+# ============================================================================
+# Entry Point
+# ============================================================================
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Generate the source, run the initial and incremental loads, build the report"""
+    started_at = datetime.now().isoformat()
+    workdir = os.path.abspath(args.workdir)
+    if os.path.exists(workdir):
+        shutil.rmtree(workdir)
+    os.makedirs(workdir)
+
+    database_path = os.path.join(workdir, "source.duckdb")
+    storage_root = args.storage_root or os.path.join(workdir, "lake")
+
+    config = DatabaseConfig(
+        storage_root=storage_root,
+        catalog_uri=f"sqlite:///{os.path.join(workdir, 'catalog.db')}",
+        iceberg_namespace=args.namespace,
+    )
+    if args.load_max_workers:
+        config.load_max_workers = args.load_max_workers
+    if args.extract_parallelism:
+        config.extract_parallelism = args.extract_parallelism
+
+    if args.config:
+        with open(args.config, 'r') as f:
+            table_defs = ConfigLoader.from_dict(json.load(f))
+    else:
+        table_defs = create_meter_data_definitions()
+    if args.source_engine:
+        for table_def in table_defs:
+            table_def.source_engine = args.source_engine
+
+    def generate(readings: int, with_dimensions: bool):
+        connection = duckdb.connect(database_path)
+        try:
+            if with_dimensions:
+                generate_dimensions(
+                    connection, args.customers, args.accounts_per_customer,
+                    args.assets_per_account, args.seed
+                )
+            generate_readings(connection, readings, args.seed)
+        finally:
+            connection.close()
+        if args.source == "postgres":
+            copy_to_postgres(database_path, config)
+
+    def make_loader() -> GenericDataLoader:
+        if args.source == "postgres":
+            data_source = create_data_source(config, table_defs)
+        else:
+            data_source = DuckDBDataSource(config, database_path)
+        return GenericDataLoader(config=config, data_source=data_source, table_definitions=table_defs)
+
+    stages = [timed_stage("generate", generate, args.readings, True)]
+    stages.append(run_load_stage("initial_load", make_loader()))
+    if args.incremental_readings:
+        stages.append(timed_stage("generate_incremental", generate, args.incremental_readings, False))
+        stages.append(run_load_stage("incremental_load", make_loader()))
+
+    return {
+        "started_at": started_at,
+        "parameters": {
+            "customers": args.customers,
+            "accounts_per_customer": args.accounts_per_customer,
+            "assets_per_account": args.assets_per_account,
+            "readings": args.readings,
+            "incremental_readings": args.incremental_readings,
+            "seed": args.seed,
+            "source": args.source,
+            "source_engine": args.source_engine,
+            "storage_root": storage_root,
+            "config": args.config,
+            "load_max_workers": config.load_max_workers,
+            "extract_parallelism": config.extract_parallelism,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "duckdb": duckdb.__version__,
+            "pyiceberg": pyiceberg.__version__,
+            "pyarrow": pyarrow.__version__,
+        },
+        "stages": stages,
+        "success": all(s.get("success", True) for s in stages),
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="End-to-end loader benchmark on synthetic meter data")
+    parser.add_argument("--customers", type=int, default=1000)
+    parser.add_argument("--accounts-per-customer", type=int, default=1)
+    parser.add_argument("--assets-per-account", type=int, default=2)
+    parser.add_argument("--readings", type=int, default=1_000_000, help="Readings in the initial load")
+    parser.add_argument(
+        "--incremental-readings", type=int, default=100_000,
+        help="Readings appended before the incremental load (0 to skip it)"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--source", choices=["duckdb", "postgres"], default="duckdb",
+        help="Load from a local DuckDB file, or copy the data into the SOURCE_* PostgreSQL"
+    )
+    parser.add_argument(
+        "--source-engine", choices=["scanner", "binary_copy"],
+        help="Source engine of every table (default: as defined; binary_copy needs --source postgres)"
+    )
+    parser.add_argument("--workdir", default="benchmark-run", help="Recreated on every run")
+    parser.add_argument(
+        "--storage-root",
+        help="Data and warehouse root, e.g. s3://bucket/benchmark (default: <workdir>/lake)"
+    )
+    parser.add_argument("--namespace", default="raw")
+    parser.add_argument("--config", help="Table configuration JSON (default: built-in definitions)")
+    parser.add_argument("--load-max-workers", type=int)
+    parser.add_argument("--extract-parallelism", type=int)
+    parser.add_argument("--output", help="Write the JSON report here (default: stdout)")
+    args = parser.parse_args(argv)
+    if args.source_engine == "binary_copy" and args.source != "postgres":
+        parser.error("--source-engine binary_copy needs --source postgres")
+
+    report = run_benchmark(args)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + "\n")
+        logger.info(f"Benchmark report written to {args.output}")
+    else:
+        print(output)
+
+    if not report["success"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,8 @@ import json
 import logging
 from load_data_generic import (
     DatabaseConfig,
-    PostgreSQLDataSource,
     GenericDataLoader,
+    create_data_source,
     ConfigLoader
 )
 
@@ -36,7 +36,7 @@ def main():
 
     # 3. Setup database and source
     config = DatabaseConfig()
-    data_source = PostgreSQLDataSource(config)
+    data_source = create_data_source(config, table_defs)
 
     # 4. Create loader and execute
     loader = GenericDataLoader(
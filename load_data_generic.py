@@ -12,22 +12,40 @@ Key Features:
 - Support for both fact and dimension tables
 """
 
+import argparse
+import importlib.util
 import os
+import sys
 import json
 import logging
+import signal
+import threading
+import time
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+from urllib.parse import quote, urlencode
 from enum import Enum
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import duckdb
+import pyarrow as pa
+from pyarrow import fs as pafs
 from pyiceberg.catalog import load_catalog
+from pyiceberg.partitioning import PartitionField, PartitionSpec
 from pyiceberg.schema import Schema
+from pyiceberg.table.snapshots import ancestors_of
+from pyiceberg.table.sorting import NullOrder, SortDirection, SortField, SortOrder
+from pyiceberg.transforms import (
+    DayTransform, HourTransform, IdentityTransform, MonthTransform, YearTransform
+)
 from pyiceberg.types import (
     NestedField, StringType, IntegerType, DecimalType,
-    TimestampType, DateType, BooleanType, LongType, FloatType, DoubleType
+    TimestampType, DateType, BooleanType, LongType, FloatType, DoubleType, BinaryType
 )
 
 # Configure logging
@@ -37,6 +55,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Snapshot summary properties identifying the table load and the loader run
+LOAD_ID_PROPERTY = "loader.load-id"
+RUN_ID_PROPERTY = "loader.run-id"
+
+# Snapshot summary properties holding the incremental watermark (state backend "iceberg")
+WATERMARK_PROPERTIES = {
+    "field": "loader.watermark-field",
+    "start": "loader.watermark-start",
+    "end": "loader.watermark",
+}
+
+# Snapshot summary property holding the plan and progress of a chunked load (JSON)
+CHECKPOINT_PROPERTY = "loader.checkpoint"
+
+# Compaction target when neither the table nor the config sets one (Iceberg default)
+DEFAULT_TARGET_FILE_SIZE_BYTES = 512 * 1024 * 1024
+
 
 # ============================================================================
 # Configuration Data Classes
@@ -65,6 +100,54 @@ class DatabaseConfig:
     catalog_type: str = "sql"  # sql, rest, hive
     iceberg_namespace: str = "raw"
 
+    # Local stand-ins (benchmarks, development); empty = S3 bucket / source PostgreSQL
+    storage_root: str = os.getenv("STORAGE_ROOT", "")  # e.g. /data/lake instead of s3://<bucket>
+    catalog_uri: str = os.getenv("CATALOG_URI", "")  # e.g. sqlite:////data/catalog.db
+
+    # Extraction
+    extract_parallelism: int = int(os.getenv("EXTRACT_PARALLELISM", "1"))  # Ranges per table
+    load_max_workers: int = int(os.getenv("LOAD_MAX_WORKERS", "4"))  # Tables loaded concurrently
+    load_chunk_rows: int = int(os.getenv("LOAD_CHUNK_ROWS", "0"))  # Rows per committed chunk (0 = off)
+
+    # Parquet output defaults (0 / empty = DuckDB default)
+    parquet_target_file_size_bytes: int = int(os.getenv("PARQUET_TARGET_FILE_SIZE_BYTES", "0"))
+    parquet_row_group_size: int = int(os.getenv("PARQUET_ROW_GROUP_SIZE", "0"))  # Rows per row group
+    parquet_compression: str = os.getenv("PARQUET_COMPRESSION", "")  # snappy, zstd, gzip, ...
+    parquet_compression_level: int = int(os.getenv("PARQUET_COMPRESSION_LEVEL", "0"))
+
+    # Arrow write engine
+    arrow_batch_rows: int = int(os.getenv("ARROW_BATCH_ROWS", "122880"))  # Rows per fetched batch
+    arrow_chunk_bytes: int = int(os.getenv("ARROW_CHUNK_BYTES", str(128 * 1024 * 1024)))  # Per append
+
+    # Incremental state: s3 (state.json) or iceberg (watermark in each table's snapshot summary)
+    state_backend: str = os.getenv("STATE_BACKEND", "s3")
+
+    # Run metrics output (empty = log only)
+    metrics_report_path: str = os.getenv("METRICS_REPORT_PATH", "")  # JSON run report
+    metrics_textfile_path: str = os.getenv("METRICS_TEXTFILE_PATH", "")  # Prometheus textfile
+
+    # DuckDB resources (empty / 0 = DuckDB default; per-table settings win)
+    duckdb_memory_limit: str = os.getenv("DUCKDB_MEMORY_LIMIT", "")  # e.g. '4GB'
+    duckdb_threads: int = int(os.getenv("DUCKDB_THREADS", "0"))
+    duckdb_temp_directory: str = os.getenv("DUCKDB_TEMP_DIRECTORY", "")  # Spill location
+    duckdb_preserve_insertion_order: str = os.getenv("DUCKDB_PRESERVE_INSERTION_ORDER", "")  # true/false
+    # adaptive: derive memory_limit, threads and concurrency from the container memory limit
+    duckdb_resource_mode: str = os.getenv("DUCKDB_RESOURCE_MODE", "static")
+    duckdb_memory_fraction: float = float(os.getenv("DUCKDB_MEMORY_FRACTION", "0.6"))  # Of the container
+    duckdb_memory_per_thread: int = int(os.getenv("DUCKDB_MEMORY_PER_THREAD", str(1024 ** 3)))
+
+    # DuckDB extensions preinstalled here are loaded without INSTALL (empty = install per run)
+    duckdb_extension_directory: str = os.getenv("DUCKDB_EXTENSION_DIRECTORY", "")
+
+    # Service mode (python load_data_generic.py serve)
+    service_interval_seconds: int = int(os.getenv("SERVICE_INTERVAL_SECONDS", "300"))
+    service_health_port: int = int(os.getenv("SERVICE_HEALTH_PORT", "8081"))  # 0 = disabled
+
+    def storage_uri(self, path: str, scheme: str = "s3") -> str:
+        """Location of path under storage_root, or under the S3 bucket"""
+        root = self.storage_root.rstrip("/") or f"{scheme}://{self.s3_bucket}"
+        return f"{root}/{path}"
+
 
 class FieldType(Enum):
     """Supported field types for schema definition"""
@@ -89,16 +172,82 @@ class FieldDefinition:
     required: bool = False
 
 
+@dataclass
+class HashColumnDefinition:
+    """Data Vault hash key or hashdiff computed during extraction"""
+    name: str
+    columns: List[str]  # Table fields, hashed in this order
+    format: str = "hex"  # hex (same as the dbt macros), binary (16-byte MD5) or bigint (first 8 bytes)
+
+
 @dataclass
 class TableDefinition:
     """Complete table definition for loading"""
     name: str
     fields: List[FieldDefinition]
     source_query: Optional[str] = None  # If None, will be generated
-    partition_field: Optional[str] = None  # For partitioned tables
+    partition_field: Optional[str] = None  # e.g. 'status' or 'day(interval_start)'
     is_incremental: bool = False
     incremental_field: Optional[str] = None  # e.g., 'creation_time'
     primary_key: Optional[str] = None
+    load_mode: str = "append"  # append, or merge (upsert on primary_key)
+    write_engine: str = "copy"  # copy (DuckDB COPY + add_files) or arrow (pyiceberg writer)
+    source_engine: str = "scanner"  # scanner (DuckDB postgres_scanner) or binary_copy (ADBC COPY)
+    parallel_ranges: Optional[int] = None  # Overrides DatabaseConfig.extract_parallelism
+    split_field: Optional[str] = None  # Defaults to incremental_field, then primary_key
+    chunk_rows: Optional[int] = None  # Overrides DatabaseConfig.load_chunk_rows (append loads)
+    # Parquet output, overriding the DatabaseConfig defaults
+    target_file_size_bytes: Optional[int] = None  # Roll into multiple files of ~this size
+    row_group_size: Optional[int] = None  # Rows per row group
+    compression: Optional[str] = None  # e.g. 'zstd'
+    compression_level: Optional[int] = None
+    hash_columns: List[HashColumnDefinition] = field(default_factory=list)  # Appended to the fields
+    sort_by: List[str] = field(default_factory=list)  # Clustering columns of exported files
+    sort_mode: str = "linear"  # linear (ORDER BY sort_by) or zorder (interleaved sort_by ranks)
+    # DuckDB resources; any of these loads the table on its own DuckDB database
+    memory_limit: Optional[str] = None  # e.g. '2GB'
+    threads: Optional[int] = None
+    temp_directory: Optional[str] = None
+    preserve_insertion_order: Optional[bool] = None
+
+
+@dataclass
+class StageMetrics:
+    """Measurements of one stage of a table load"""
+    stage: str
+    seconds: float = 0.0
+    rows: int = 0
+    bytes_written: int = 0
+    files: int = 0
+    retries: int = 0  # Catalog commit retries
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, rows: int = 0, bytes_written: int = 0, files: int = 0) -> None:
+        """Accumulate counts, e.g. from parallel range exports"""
+        with self._lock:
+            self.rows += rows
+            self.bytes_written += bytes_written
+            self.files += files
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "seconds": round(self.seconds, 3),
+            "rows": self.rows,
+            "bytes_written": self.bytes_written,
+            "files": self.files,
+            "retries": self.retries,
+        }
+
+
+@dataclass
+class TableLoadResult:
+    """Outcome of loading a single table"""
+    table_name: str
+    success: bool
+    duration_seconds: float
+    error: Optional[str] = None
+    stages: List[StageMetrics] = field(default_factory=list)
 
 
 # ============================================================================
@@ -108,6 +257,14 @@ class TableDefinition:
 class StateManagerInterface(ABC):
     """Interface for managing incremental load state"""
 
+    # True when the watermark is committed together with the data
+    # (via watermark_properties) instead of being saved afterwards
+    commits_with_data: bool = False
+
+    def watermark_properties(self, table_def: "TableDefinition", window: Tuple[Any, Any]) -> Dict[str, str]:
+        """Snapshot properties recording a window's watermark in its data commit"""
+        return {}
+
     @abstractmethod
     def get_state(self) -> Dict[str, Any]:
         """Retrieve current state"""
@@ -120,7 +277,7 @@ class StateManagerInterface(ABC):
 
     @abstractmethod
     def get_last_processed_value(self, table_name: str, field_name: str) -> Tuple[Any, Dict]:
-        """Get last processed value for incremental loads"""
+        """Get last processed value for incremental loads (None if never loaded)"""
         pass
 
 
@@ -147,6 +304,41 @@ class DataSourceInterface(ABC):
         """Return connection string for DuckDB attach"""
         pass
 
+    def create_worker_connection(self, connection) -> Any:
+        """Open an additional connection for parallel extraction workers
+
+        The default shares the DuckDB database (and its attached source) of
+        the given connection through a new cursor.
+        """
+        return connection.cursor()
+
+    def create_isolated_connection(self) -> Any:
+        """Open a connection on a separate DuckDB database with the source attached
+
+        Used for tables with their own DuckDB resource settings, which are
+        database-wide. The default returns None: such tables then share the
+        main database and its settings.
+        """
+        return None
+
+    def check_connection(self, connection) -> None:
+        """Raise if the connection can no longer serve a load (used by service mode)"""
+        connection.execute("SELECT 1").fetchone()
+
+
+class ArrowSourceInterface(ABC):
+    """Interface for data sources that can be read outside DuckDB (source_engine 'binary_copy')"""
+
+    @abstractmethod
+    def read_arrow(
+        self,
+        table_def: TableDefinition,
+        source_schema: str,
+        predicate: Optional[str] = None
+    ) -> pa.RecordBatchReader:
+        """Stream a table's fields as Arrow batches"""
+        pass
+
 
 # ============================================================================
 # Concrete Implementations - State Management
@@ -155,11 +347,17 @@ class DataSourceInterface(ABC):
 class S3StateManager(StateManagerInterface):
     """S3-based state manager for incremental loads"""
 
-    def __init__(self, connection, bucket: str, state_file: str = "state.json"):
+    def __init__(
+        self,
+        connection,
+        bucket: str,
+        state_file: str = "state.json",
+        root: Optional[str] = None
+    ):
         self.connection = connection
         self.bucket = bucket
         self.state_file = state_file
-        self.state_path = f"s3://{bucket}/{state_file}"
+        self.state_path = f"{root or f's3://{bucket}'}/{state_file}"
 
     def get_state(self) -> Dict[str, Any]:
         """Retrieve state from S3"""
@@ -196,16 +394,106 @@ class S3StateManager(StateManagerInterface):
         table_state_key = f"{table_name}_window"
 
         if table_state_key in state:
-            last_value = state[table_state_key].get('end', '1900-01-01 00:00:00')
+            last_value = state[table_state_key].get('end')
         elif table_name in state:
-            last_value = state[table_name].get(field_name, '1900-01-01 00:00:00')
+            last_value = state[table_name].get(field_name)
         else:
-            last_value = '1900-01-01 00:00:00'
+            last_value = None
 
         logger.info(f"Last processed {field_name} for {table_name}: {last_value}")
         return last_value, state
 
 
+class IcebergSnapshotStateManager(StateManagerInterface):
+    """Incremental state kept in the snapshot summaries of the loaded tables
+
+    The window of each load is written as snapshot properties of the same
+    Iceberg commit that adds its data, so data and watermark can never
+    diverge: a failed load leaves both untouched and is simply re-run. The
+    watermark is read back from the newest snapshot in the table's history
+    that carries it (maintenance commits carry it forward). Tables without
+    one fall back to the legacy state manager, if given, for migration.
+    """
+
+    commits_with_data = True
+
+    def __init__(self, table_manager: "IcebergTableManager", legacy: Optional[StateManagerInterface] = None):
+        self.table_manager = table_manager
+        self.legacy = legacy
+
+    @staticmethod
+    def latest_watermark(table) -> Dict[str, str]:
+        """Watermark properties of the newest snapshot that has them"""
+        for snapshot in ancestors_of(table.current_snapshot(), table.metadata):
+            summary = snapshot.summary
+            if summary is not None and summary.get(WATERMARK_PROPERTIES["end"]) is not None:
+                return {
+                    prop: summary.get(prop)
+                    for prop in WATERMARK_PROPERTIES.values()
+                    if summary.get(prop) is not None
+                }
+        return {}
+
+    def watermark_properties(self, table_def: "TableDefinition", window: Tuple[Any, Any]) -> Dict[str, str]:
+        start, end = window
+        properties = {
+            WATERMARK_PROPERTIES["field"]: table_def.incremental_field,
+            WATERMARK_PROPERTIES["end"]: str(end),
+        }
+        if start is not None:
+            properties[WATERMARK_PROPERTIES["start"]] = str(start)
+        return properties
+
+    def _load_table(self, table_name: str):
+        catalog = self.table_manager._get_catalog()
+        identifier = (self.table_manager.config.iceberg_namespace, table_name)
+        if not catalog.table_exists(identifier):
+            return None
+        return catalog.load_table(identifier)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Watermarks of all tables in the namespace, in the state.json layout"""
+        catalog = self.table_manager._get_catalog()
+        state = {}
+        for identifier in catalog.list_tables(self.table_manager.config.iceberg_namespace):
+            watermark = self.latest_watermark(catalog.load_table(identifier))
+            if watermark:
+                state[f"{identifier[-1]}_window"] = {
+                    "field": watermark.get(WATERMARK_PROPERTIES["field"]),
+                    "start": watermark.get(WATERMARK_PROPERTIES["start"]),
+                    "end": watermark[WATERMARK_PROPERTIES["end"]],
+                }
+        return state
+
+    def save_state(self, state: Dict[str, Any]) -> None:
+        """No-op: each watermark is written with its Iceberg data commit
+
+        The loader never calls this (commits_with_data); watermarks live in
+        the snapshot summaries, so there is no separate state to persist.
+        """
+
+    def get_last_processed_value(self, table_name: str, field_name: str) -> Tuple[Any, Dict]:
+        """Get last processed value for a specific table/field"""
+        table = self._load_table(table_name)
+        watermark = self.latest_watermark(table) if table is not None else {}
+        recorded_field = watermark.get(WATERMARK_PROPERTIES["field"], field_name)
+
+        if watermark and recorded_field == field_name:
+            last_value = watermark[WATERMARK_PROPERTIES["end"]]
+        elif watermark:
+            logger.warning(
+                f"Watermark of {table_name} is on {recorded_field}, not {field_name}; reloading"
+            )
+            last_value = None
+        elif self.legacy is not None:
+            return self.legacy.get_last_processed_value(table_name, field_name)
+        else:
+            last_value = None
+
+        logger.info(f"Last processed {field_name} for {table_name}: {last_value}")
+        return last_value, {}
+
+
 # ============================================================================
 # Concrete Implementations - Data Sources
 # ============================================================================
@@ -219,16 +507,27 @@ class PostgreSQLDataSource(DataSourceInterface):
 
     def connect(self) -> duckdb.DuckDBPyConnection:
         """Connect to PostgreSQL via DuckDB"""
-        self.connection = duckdb.connect(":memory:")
+        self.connection = self.create_isolated_connection()
+        return self.connection
 
-        # Load extensions
-        self.connection.execute("INSTALL postgres_scanner; LOAD postgres_scanner;")
-        self.connection.execute("INSTALL httpfs; LOAD httpfs;")
+    def create_isolated_connection(self) -> duckdb.DuckDBPyConnection:
+        """Open a new in-memory DuckDB database with PostgreSQL attached and S3 configured"""
+        connection = duckdb.connect(":memory:")
+
+        # Load extensions (preinstalled ones are only loaded)
+        if self.config.duckdb_extension_directory:
+            connection.execute(
+                f"SET extension_directory='{self.config.duckdb_extension_directory}';"
+            )
+            connection.execute("LOAD postgres_scanner; LOAD httpfs;")
+        else:
+            connection.execute("INSTALL postgres_scanner; LOAD postgres_scanner;")
+            connection.execute("INSTALL httpfs; LOAD httpfs;")
 
         # Attach PostgreSQL
         conn_str = self.get_connection_string()
-        self.connection.execute(f"ATTACH '{conn_str}' AS raw (TYPE postgres);")
-        self.connection.execute("USE raw;")
+        connection.execute(f"ATTACH '{conn_str}' AS raw (TYPE postgres);")
+        connection.execute("USE raw;")
 
         # Configure S3
         s3_config = f"""
@@ -239,14 +538,25 @@ class PostgreSQLDataSource(DataSourceInterface):
             SET s3_url_style='path';
             SET s3_use_ssl=false;
         """
-        self.connection.execute(s3_config)
+        connection.execute(s3_config)
 
-        return self.connection
+        return connection
 
     def disconnect(self) -> None:
         """Close connection"""
         if self.connection:
             self.connection.close()
+            self.connection = None
+
+    def create_worker_connection(self, connection) -> duckdb.DuckDBPyConnection:
+        """Open a cursor on the shared DuckDB database with the source selected"""
+        cursor = connection.cursor()
+        cursor.execute("USE raw;")
+        return cursor
+
+    def check_connection(self, connection) -> None:
+        """Round-trip to PostgreSQL through the attached database"""
+        connection.execute("SELECT * FROM postgres_query('raw', 'SELECT 1')").fetchone()
 
     def get_scanner_extension(self) -> str:
         return "postgres_scanner"
@@ -261,6 +571,116 @@ class PostgreSQLDataSource(DataSourceInterface):
         )
 
 
+class PostgreSQLCopySource(PostgreSQLDataSource, ArrowSourceInterface):
+    """PostgreSQL source adding binary COPY extraction via ADBC
+
+    Tables with source_engine 'binary_copy' are read by the ADBC PostgreSQL
+    driver, which runs the query as COPY ... TO STDOUT (FORMAT BINARY) and
+    decodes the stream into Arrow batches in C++ (outside the GIL), over its
+    own connection per extraction range. DuckDB reads those batches in place
+    of the postgres_scanner. Other tables, range planning and watermarks
+    still use the attached database.
+    """
+
+    # FieldType -> PostgreSQL type each field is cast to; ADBC maps these onto
+    # the table's Arrow types, except numeric, which is sent as text and cast
+    # by Arrow
+    WIRE_TYPES = {
+        FieldType.STRING: "text",
+        FieldType.INTEGER: "int4",
+        FieldType.LONG: "int8",
+        FieldType.FLOAT: "float4",
+        FieldType.DOUBLE: "float8",
+        FieldType.DECIMAL: "text",
+        FieldType.BOOLEAN: "bool",
+        FieldType.DATE: "date",
+        FieldType.TIMESTAMP: "timestamp",
+    }
+
+    @staticmethod
+    def arrow_type(field_def: FieldDefinition) -> pa.DataType:
+        return {
+            FieldType.STRING: pa.string(),
+            FieldType.INTEGER: pa.int32(),
+            FieldType.LONG: pa.int64(),
+            FieldType.FLOAT: pa.float32(),
+            FieldType.DOUBLE: pa.float64(),
+            FieldType.DECIMAL: pa.decimal128(field_def.precision or 15, field_def.scale or 3),
+            FieldType.BOOLEAN: pa.bool_(),
+            FieldType.DATE: pa.date32(),
+            FieldType.TIMESTAMP: pa.timestamp("us"),
+        }[field_def.type]
+
+    @classmethod
+    def copy_query(cls, table_def: TableDefinition, source_schema: str, predicate: Optional[str]) -> str:
+        """SELECT sending the table's fields in the wire types above"""
+        casts = []
+        for f in table_def.fields:
+            if f.type == FieldType.DECIMAL:
+                # Rounded to the declared scale so Arrow's text-to-decimal cast is exact
+                casts.append(f"{f.name}::numeric({f.precision or 15}, {f.scale or 3})::text AS {f.name}")
+            else:
+                casts.append(f"{f.name}::{cls.WIRE_TYPES[f.type]} AS {f.name}")
+        columns = ", ".join(casts)
+        source = (
+            f"({table_def.source_query}) AS src" if table_def.source_query
+            else f"{source_schema}.{table_def.name}"
+        )
+        where = f" WHERE {predicate}" if predicate else ""
+        return f"SELECT {columns} FROM {source}{where}"
+
+    def get_uri(self) -> str:
+        """PostgreSQL connection URI (ADBC takes no keyword/value strings)"""
+        return (
+            f"postgresql://{quote(self.config.source_user, safe='')}:"
+            f"{quote(self.config.source_password, safe='')}@"
+            f"{self.config.source_host}:{self.config.source_port}/{self.config.source_db}"
+        )
+
+    def read_arrow(
+        self,
+        table_def: TableDefinition,
+        source_schema: str,
+        predicate: Optional[str] = None
+    ) -> pa.RecordBatchReader:
+        """Stream the table's fields as Arrow batches over binary COPY"""
+        # Only needed for source_engine 'binary_copy'
+        import adbc_driver_postgresql.dbapi as adbc_postgresql
+
+        schema = pa.schema([(f.name, self.arrow_type(f)) for f in table_def.fields])
+        query = self.copy_query(table_def, source_schema, predicate)
+
+        def batches() -> Iterator[pa.RecordBatch]:
+            with adbc_postgresql.connect(self.get_uri()) as pg_connection, \
+                    pg_connection.cursor() as cursor:
+                cursor.execute(query)
+                for batch in cursor.fetch_record_batch():
+                    yield pa.RecordBatch.from_arrays(
+                        [column.cast(t) for column, t in zip(batch.columns, schema.types)],
+                        schema=schema
+                    )
+
+        logger.info(f"Streaming {table_def.name} over binary COPY")
+        return pa.RecordBatchReader.from_batches(schema, batches())
+
+
+def create_data_source(config: DatabaseConfig, table_defs: List[TableDefinition]) -> DataSourceInterface:
+    """PostgreSQL source supporting the source engines the tables ask for
+
+    binary_copy needs the optional adbc-driver-postgresql package; a missing
+    driver is reported here, before any table is loaded.
+    """
+    copy_tables = [t.name for t in table_defs if t.source_engine == "binary_copy"]
+    if copy_tables:
+        if importlib.util.find_spec("adbc_driver_postgresql") is None:
+            raise ImportError(
+                f"source_engine 'binary_copy' of {', '.join(copy_tables)} needs the "
+                f"adbc-driver-postgresql package (pip install adbc-driver-postgresql)"
+            )
+        return PostgreSQLCopySource(config)
+    return PostgreSQLDataSource(config)
+
+
 # ============================================================================
 # Schema Conversion
 # ============================================================================
@@ -295,34 +715,245 @@ class SchemaConverter:
         DuckDB's Parquet export behavior, which always creates nullable columns.
         """
         fields = []
-        for idx, field in enumerate(table_def.fields, start=1):
+        for idx, fdef in enumerate(table_def.fields, start=1):
             iceberg_type = SchemaConverter.field_type_to_iceberg(
-                field.type, field.precision, field.scale
+                fdef.type, fdef.precision, fdef.scale
             )
             fields.append(NestedField(
                 field_id=idx,
-                name=field.name,
+                name=fdef.name,
                 field_type=iceberg_type,
                 required=False  # Always False to match Parquet nullable columns
             ))
 
+        for idx, hash_column in enumerate(table_def.hash_columns, start=len(fields) + 1):
+            fields.append(NestedField(
+                field_id=idx,
+                name=hash_column.name,
+                field_type=SchemaConverter.HASH_FORMATS[hash_column.format](),
+                required=False
+            ))
+
         return Schema(*fields)
 
+    # Iceberg type of each hash column format
+    HASH_FORMATS = {
+        "hex": StringType,
+        "binary": BinaryType,
+        "bigint": LongType,
+    }
+
     @staticmethod
-    def generate_source_query(table_def: TableDefinition, source_schema: str) -> str:
-        """Generate default SQL query for table extraction"""
-        if table_def.source_query:
-            return table_def.source_query
+    def hash_input_expression(field: FieldDefinition) -> str:
+        """DuckDB VARCHAR rendering of a field, matching Trino's CAST(... AS VARCHAR)"""
+        if field.type == FieldType.TIMESTAMP:
+            # Trino renders timestamp(6) with all six fractional digits
+            return f"strftime({field.name}, '%Y-%m-%d %H:%M:%S.%f')"
+        if field.type in (FieldType.FLOAT, FieldType.DOUBLE):
+            # Trino renders doubles in scientific notation, DuckDB does not
+            raise ValueError(f"Floating point field {field.name} cannot be hashed consistently")
+        return f"CAST({field.name} AS VARCHAR)"
+
+    @staticmethod
+    def hash_expression(table_def: TableDefinition, hash_column: HashColumnDefinition) -> str:
+        """DuckDB expression for a hash column
+
+        Uses the canonicalisation of the hash_key/hash_diff dbt macros: each
+        value cast to VARCHAR, NULL as '', joined with '||' and MD5 hashed.
+        The hex form equals Trino's TO_HEX(MD5(TO_UTF8(...))); binary equals
+        MD5(TO_UTF8(...)) and bigint equals from_big_endian_64 of its first
+        8 bytes.
+        """
+        if hash_column.format not in SchemaConverter.HASH_FORMATS:
+            raise ValueError(f"Unsupported hash format: {hash_column.format}")
+
+        fields = {f.name: f for f in table_def.fields}
+        parts = []
+        for column in hash_column.columns:
+            if column not in fields:
+                raise ValueError(f"Hash column {hash_column.name} references unknown field {column}")
+            parts.append(f"COALESCE({SchemaConverter.hash_input_expression(fields[column])}, '')")
+        digest = "md5(" + " || '||' || ".join(parts) + ")"
+
+        if hash_column.format == "binary":
+            return f"unhex({digest})"
+        if hash_column.format == "bigint":
+            # Reinterpret the first 8 bytes as a signed big-endian integer
+            unsigned = f"CAST(CAST('0x' || substr({digest}, 1, 16) AS UBIGINT) AS HUGEINT)"
+            return (
+                f"CAST(({unsigned} + 9223372036854775808) % 18446744073709551616"
+                f" - 9223372036854775808 AS BIGINT)"
+            )
+        return f"upper({digest})"
+
+    # Supported partition transforms: Iceberg transform and the DuckDB
+    # expression used to derive the Hive partition directory value
+    PARTITION_TRANSFORMS = {
+        "identity": (IdentityTransform, "{field}"),
+        "year": (YearTransform, "year({field})"),
+        "month": (MonthTransform, "strftime({field}, '%Y-%m')"),
+        "day": (DayTransform, "CAST({field} AS DATE)"),
+        "hour": (HourTransform, "strftime({field}, '%Y-%m-%d-%H')"),
+    }
 
-        field_names = [f.name for f in table_def.fields]
+    @staticmethod
+    def parse_partition_field(partition_field: str) -> Tuple[str, str]:
+        """Parse 'field' or 'transform(field)' into (transform, field)"""
+        spec = partition_field.strip()
+        if spec.endswith(")") and "(" in spec:
+            transform, field = spec[:-1].split("(", 1)
+            transform, field = transform.strip().lower(), field.strip()
+        else:
+            transform, field = "identity", spec
+
+        if transform not in SchemaConverter.PARTITION_TRANSFORMS:
+            raise ValueError(f"Unsupported partition transform: {partition_field}")
+        return transform, field
+
+    @staticmethod
+    def partition_column_name(partition_field: str) -> str:
+        """Name of the derived column used for Hive-style partition directories"""
+        transform, field = SchemaConverter.parse_partition_field(partition_field)
+        return f"{field}_{transform}"
+
+    @staticmethod
+    def partition_expression(partition_field: str) -> str:
+        """DuckDB expression producing the partition directory value"""
+        transform, field = SchemaConverter.parse_partition_field(partition_field)
+        return SchemaConverter.PARTITION_TRANSFORMS[transform][1].format(field=field)
+
+    @staticmethod
+    def table_definition_to_partition_spec(table_def: TableDefinition, schema: Schema) -> PartitionSpec:
+        """Build the Iceberg PartitionSpec matching the exported file layout"""
+        if not table_def.partition_field:
+            return PartitionSpec()
+
+        transform, field = SchemaConverter.parse_partition_field(table_def.partition_field)
+        source_id = schema.find_field(field).field_id
+        name = field if transform == "identity" else f"{field}_{transform}"
+        return PartitionSpec(PartitionField(
+            source_id=source_id,
+            field_id=1000,
+            transform=SchemaConverter.PARTITION_TRANSFORMS[transform][0](),
+            name=name
+        ))
+
+    # Bits of each column's rank interleaved into a z-order value
+    ZORDER_BITS = 10
+
+    @staticmethod
+    def table_definition_to_sort_order(table_def: TableDefinition, schema: Schema) -> SortOrder:
+        """Build the Iceberg SortOrder matching the exported row order
+
+        Iceberg has no z-order transform, so z-ordered tables stay unsorted.
+        """
+        if not table_def.sort_by or table_def.sort_mode == "zorder":
+            return SortOrder()
+        return SortOrder(*[
+            SortField(
+                source_id=schema.find_field(column).field_id,
+                transform=IdentityTransform(),
+                direction=SortDirection.ASC,
+                null_order=NullOrder.NULLS_LAST
+            )
+            for column in table_def.sort_by
+        ])
+
+    @staticmethod
+    def apply_sort_order(table_def: TableDefinition, query: str) -> str:
+        """Order a query's rows by the table's sort_by columns
+
+        Linear mode sorts lexicographically, so Parquet statistics are tight
+        on the first column. Z-order buckets each column into 2^ZORDER_BITS
+        ranks and sorts on the interleaved bits, so files and row groups stay
+        narrow on all columns at once (e.g. per-meter and time-window filters).
+        """
+        if not table_def.sort_by:
+            return query
+
+        if table_def.sort_mode == "linear" or len(table_def.sort_by) == 1:
+            order_by = ", ".join(f"{column} ASC NULLS LAST" for column in table_def.sort_by)
+            return f"SELECT * FROM ({query}) AS sorted ORDER BY {order_by}"
+        if table_def.sort_mode != "zorder":
+            raise ValueError(f"Unknown sort_mode '{table_def.sort_mode}' for {table_def.name}")
+
+        bits = SchemaConverter.ZORDER_BITS
+        ranks = [f"__zorder_{i}" for i in range(len(table_def.sort_by))]
+        rank_exprs = ", ".join(
+            f"ntile({1 << bits}) OVER (ORDER BY {column} ASC NULLS LAST) - 1 AS {rank}"
+            for column, rank in zip(table_def.sort_by, ranks)
+        )
+        # Bit b of rank i lands at position b * len(ranks) + i
+        z_value = " + ".join(
+            f"((({rank} >> {bit}) & 1) << {bit * len(ranks) + i})"
+            for bit in range(bits)
+            for i, rank in enumerate(ranks)
+        )
+        return f"""
+            SELECT * EXCLUDE ({", ".join(ranks)})
+            FROM (SELECT *, {rank_exprs} FROM ({query}) AS src) AS ranked
+            ORDER BY {z_value}
+        """
+
+    @staticmethod
+    def to_sql_literal(value: Any, field_type: FieldType) -> str:
+        """Render a Python value as a typed SQL literal for predicates"""
+        if field_type == FieldType.TIMESTAMP:
+            return f"TIMESTAMP '{value}'"
+        if field_type == FieldType.DATE:
+            return f"DATE '{value}'"
+        if field_type in (FieldType.INTEGER, FieldType.LONG, FieldType.FLOAT,
+                          FieldType.DOUBLE, FieldType.DECIMAL):
+            return str(value)
+        escaped = str(value).replace("'", "''")
+        return f"'{escaped}'"
+
+    @staticmethod
+    def generate_source_query(
+        table_def: TableDefinition,
+        source_schema: str,
+        predicate: Optional[str] = None,
+        source_relation: Optional[str] = None
+    ) -> str:
+        """Generate default SQL query for table extraction
+
+        An optional predicate (e.g. an incremental window) is added as a WHERE
+        clause so DuckDB can push it down into the source scanner. Declared
+        hash columns are computed alongside the fields, and rows are ordered
+        by sort_by (default: the primary key). source_relation replaces the
+        source table (and any source_query), e.g. with a registered Arrow stream.
+        """
+        hash_exprs = [
+            f"{SchemaConverter.hash_expression(table_def, h)} AS {h.name}"
+            for h in table_def.hash_columns
+        ]
+
+        if table_def.source_query and not source_relation:
+            if predicate or hash_exprs:
+                select_list = ", ".join(["*"] + hash_exprs)
+                query = f"""
+            SELECT {select_list} FROM ({table_def.source_query}) AS src
+        """
+                if predicate:
+                    query += f"    WHERE {predicate}\n        "
+                return SchemaConverter.apply_sort_order(table_def, query)
+            return SchemaConverter.apply_sort_order(table_def, table_def.source_query)
+
+        field_names = [f.name for f in table_def.fields] + hash_exprs
         fields_str = ",\n                ".join(field_names)
 
         query = f"""
             SELECT
                 {fields_str}
-            FROM {source_schema}.{table_def.name}
+            FROM {source_relation or f"{source_schema}.{table_def.name}"}
         """
 
+        if predicate:
+            query += f"\n            WHERE {predicate}"
+
+        if table_def.sort_by:
+            return SchemaConverter.apply_sort_order(table_def, query)
+
         # Add ordering if there's a primary key
         if table_def.primary_key:
             query += f"\n            ORDER BY {table_def.primary_key}"
@@ -330,6 +961,262 @@ class SchemaConverter:
         return query
 
 
+# ============================================================================
+# Load Metrics
+# ============================================================================
+
+class LoadMetrics:
+    """Per-table, per-stage metrics of one loader run
+
+    Stages are recorded from several worker threads. The run ID is also
+    written to every snapshot summary (loader.run-id), so a report can be
+    matched to the Iceberg commits it describes.
+    """
+
+    # Prometheus gauges: (name, StageMetrics attribute, help)
+    STAGE_GAUGES = [
+        ("loader_stage_duration_seconds", "seconds", "Wall time of a load stage"),
+        ("loader_stage_rows", "rows", "Rows processed by a load stage"),
+        ("loader_stage_bytes", "bytes_written", "Bytes written by a load stage"),
+        ("loader_stage_files", "files", "Files written or committed by a load stage"),
+        ("loader_stage_retries", "retries", "Catalog commit retries of a load stage"),
+    ]
+
+    def __init__(self, run_id: Optional[str] = None):
+        self.run_id = run_id or str(uuid.uuid4())
+        self.started_at = datetime.utcnow()
+        self._stages: Dict[str, List[StageMetrics]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, table_name: str, stage: str):
+        """Time a stage; counts are set on the yielded StageMetrics"""
+        metrics = StageMetrics(stage)
+        started = time.monotonic()
+        try:
+            yield metrics
+        finally:
+            metrics.seconds = time.monotonic() - started
+            with self._lock:
+                self._stages.setdefault(table_name, []).append(metrics)
+
+    def table_stages(self, table_name: str) -> List[StageMetrics]:
+        with self._lock:
+            return list(self._stages.get(table_name, []))
+
+    def to_report(self, results: List[TableLoadResult]) -> Dict[str, Any]:
+        """JSON-serialisable run report"""
+        finished_at = datetime.utcnow()
+        return {
+            "run_id": self.run_id,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": finished_at.isoformat(),
+            "duration_seconds": round((finished_at - self.started_at).total_seconds(), 3),
+            "success": all(r.success for r in results),
+            "tables": [
+                {
+                    "table": r.table_name,
+                    "success": r.success,
+                    "duration_seconds": round(r.duration_seconds, 3),
+                    "error": r.error,
+                    "stages": [m.to_dict() for m in r.stages],
+                }
+                for r in results
+            ],
+        }
+
+    def to_prometheus(self, results: List[TableLoadResult]) -> str:
+        """Prometheus text exposition format (for the node_exporter textfile collector)"""
+        lines = [
+            "# HELP loader_run_info Loader run identifier",
+            "# TYPE loader_run_info gauge",
+            f'loader_run_info{{run_id="{self.run_id}"}} 1',
+            "# HELP loader_run_timestamp_seconds Start of the loader run",
+            "# TYPE loader_run_timestamp_seconds gauge",
+            f"loader_run_timestamp_seconds {self.started_at.timestamp():.3f}",
+            "# HELP loader_table_success Whether the table loaded successfully",
+            "# TYPE loader_table_success gauge",
+        ]
+        lines += [f'loader_table_success{{table="{r.table_name}"}} {int(r.success)}' for r in results]
+        lines += [
+            "# HELP loader_table_duration_seconds Wall time of the table load",
+            "# TYPE loader_table_duration_seconds gauge",
+        ]
+        lines += [
+            f'loader_table_duration_seconds{{table="{r.table_name}"}} {r.duration_seconds:.3f}'
+            for r in results
+        ]
+
+        # Stages repeated within a table (e.g. per chunk) are summed
+        totals: Dict[Tuple[str, str], Dict[str, float]] = {}
+        for r in results:
+            for m in r.stages:
+                total = totals.setdefault((r.table_name, m.stage), {})
+                for _, attribute, _ in self.STAGE_GAUGES:
+                    total[attribute] = total.get(attribute, 0) + getattr(m, attribute)
+
+        for name, attribute, help_text in self.STAGE_GAUGES:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            lines += [
+                f'{name}{{table="{table}",stage="{stage}"}} {round(values[attribute], 3)}'
+                for (table, stage), values in totals.items()
+            ]
+        return "\n".join(lines) + "\n"
+
+    def write(
+        self,
+        results: List[TableLoadResult],
+        report_path: str = "",
+        textfile_path: str = ""
+    ) -> None:
+        """Write the JSON report and/or Prometheus textfile (atomically renamed)"""
+        outputs = [
+            (report_path, lambda: json.dumps(self.to_report(results), indent=2) + "\n"),
+            (textfile_path, lambda: self.to_prometheus(results)),
+        ]
+        for path, render in outputs:
+            if not path:
+                continue
+            temp_path = f"{path}.{self.run_id}.tmp"
+            with open(temp_path, "w") as f:
+                f.write(render())
+            os.replace(temp_path, path)
+            logger.info(f"Run metrics written to {path}")
+
+
+# ============================================================================
+# Resource Governance
+# ============================================================================
+
+class ResourceGovernor:
+    """DuckDB memory, thread and spill settings for a loader run
+
+    Settings come from DatabaseConfig (DUCKDB_*), overridden per table by
+    TableDefinition. DuckDB applies them to the whole database, so tables
+    with their own settings are loaded on an isolated database.
+
+    In adaptive mode, memory_limit and threads are derived from the
+    container memory limit (cgroup v2 or v1): memory_limit is
+    duckdb_memory_fraction of it and threads one per
+    duckdb_memory_per_thread, and concurrent tables and extraction ranges
+    are capped at that thread count. Explicit settings still win.
+    """
+
+    CGROUP_MEMORY_FILES = [
+        "/sys/fs/cgroup/memory.max",  # cgroup v2
+        "/sys/fs/cgroup/memory/memory.limit_in_bytes",  # cgroup v1
+    ]
+    # cgroup v1 reports "unlimited" as a huge page-aligned number
+    UNLIMITED_MEMORY = 1 << 60
+
+    def __init__(self, config: DatabaseConfig):
+        self.config = config
+        self.container_memory = None
+        self.adaptive_threads = None
+        self.adaptive_memory_limit = None
+        if config.duckdb_resource_mode == "adaptive":
+            self.container_memory = self.detect_container_memory()
+            if self.container_memory:
+                per_thread = max(1, config.duckdb_memory_per_thread)
+                cpus = os.cpu_count() or 1
+                self.adaptive_threads = max(1, min(cpus, self.container_memory // per_thread))
+                limit_mib = int(self.container_memory * config.duckdb_memory_fraction) // (1024 ** 2)
+                self.adaptive_memory_limit = f"{max(1, limit_mib)}MiB"
+                logger.info(
+                    f"Adaptive resources: container memory {self.container_memory // (1024 ** 2)} MiB, "
+                    f"memory_limit={self.adaptive_memory_limit}, threads={self.adaptive_threads}"
+                )
+            else:
+                logger.info("Adaptive resources: no container memory limit, using static settings")
+
+    @classmethod
+    def detect_container_memory(cls) -> Optional[int]:
+        """Memory limit of the container in bytes, or None when unlimited or unknown"""
+        for path in cls.CGROUP_MEMORY_FILES:
+            try:
+                with open(path) as f:
+                    value = f.read().strip()
+            except OSError:
+                continue
+            if value == "max":
+                return None
+            try:
+                limit = int(value)
+            except ValueError:
+                continue
+            return limit if 0 < limit < cls.UNLIMITED_MEMORY else None
+        return None
+
+    def global_settings(self) -> Dict[str, Any]:
+        """Database-wide DuckDB settings of the run"""
+        settings: Dict[str, Any] = {}
+        memory_limit = self.config.duckdb_memory_limit or self.adaptive_memory_limit
+        if memory_limit:
+            settings["memory_limit"] = memory_limit
+        threads = self.config.duckdb_threads or self.adaptive_threads
+        if threads:
+            settings["threads"] = threads
+        if self.config.duckdb_temp_directory:
+            settings["temp_directory"] = self.config.duckdb_temp_directory
+        if self.config.duckdb_preserve_insertion_order:
+            settings["preserve_insertion_order"] = (
+                self.config.duckdb_preserve_insertion_order.lower() in ("1", "true", "yes")
+            )
+        return settings
+
+    @staticmethod
+    def has_overrides(table_def: TableDefinition) -> bool:
+        """Whether a table needs DuckDB settings of its own"""
+        return any(
+            value is not None for value in (
+                table_def.memory_limit, table_def.threads,
+                table_def.temp_directory, table_def.preserve_insertion_order,
+            )
+        )
+
+    def table_settings(self, table_def: TableDefinition) -> Dict[str, Any]:
+        """Global settings with the table's overrides applied"""
+        settings = self.global_settings()
+        if table_def.memory_limit is not None:
+            settings["memory_limit"] = table_def.memory_limit
+        if table_def.threads is not None:
+            settings["threads"] = table_def.threads
+        if table_def.temp_directory is not None:
+            settings["temp_directory"] = table_def.temp_directory
+        if table_def.preserve_insertion_order is not None:
+            settings["preserve_insertion_order"] = table_def.preserve_insertion_order
+        return settings
+
+    def max_workers(self, requested: int) -> int:
+        """Cap concurrently loaded tables (adaptive mode)"""
+        if self.adaptive_threads:
+            return max(1, min(requested, self.adaptive_threads))
+        return requested
+
+    def max_ranges(self, requested: int, table_def: TableDefinition) -> int:
+        """Cap concurrent extraction ranges of a table (adaptive mode)"""
+        threads = table_def.threads or self.adaptive_threads
+        if threads and self.config.duckdb_resource_mode == "adaptive":
+            return max(1, min(requested, threads))
+        return requested
+
+    @staticmethod
+    def apply(connection, settings: Dict[str, Any]) -> None:
+        """SET the given settings on a DuckDB connection"""
+        for name, value in settings.items():
+            if isinstance(value, bool):
+                literal = "true" if value else "false"
+            elif isinstance(value, int):
+                literal = str(value)
+            else:
+                literal = "'" + str(value).replace("'", "''") + "'"
+            connection.execute(f"SET {name} = {literal};")
+        if settings:
+            logger.info(
+                "DuckDB settings: " + ", ".join(f"{k}={v}" for k, v in settings.items())
+            )
+
+
 # ============================================================================
 # Iceberg Table Manager
 # ============================================================================
@@ -341,17 +1228,57 @@ class IcebergTableManager:
         self.config = config
         self.data_source = data_source
         self._catalog = None
+        # Tables may be loaded from several worker threads
+        self._catalog_lock = threading.RLock()
+        self._state_lock = threading.Lock()
+        self.metrics = LoadMetrics()
+        self.resources = ResourceGovernor(config)
+        # Extra snapshot properties per load ID (e.g. watermarks committed with the data)
+        self._load_properties: Dict[str, Dict[str, str]] = {}
+
+    def snapshot_properties(self, load_id: str) -> Dict[str, str]:
+        """Snapshot summary properties tagging a commit with its load and run"""
+        return {
+            LOAD_ID_PROPERTY: load_id,
+            RUN_ID_PROPERTY: self.metrics.run_id,
+            **self._load_properties.get(load_id, {}),
+        }
+
+    @staticmethod
+    def record_snapshots(stage: StageMetrics, table, load_id: str) -> None:
+        """Take committed rows, bytes and files from the snapshot summaries of a load"""
+        rows = bytes_written = files = 0
+        for snapshot in table.metadata.snapshots:
+            summary = snapshot.summary
+            if summary is None or summary.get(LOAD_ID_PROPERTY) != load_id:
+                continue
+            # Summary.get ignores defaults; delete snapshots have no added-* keys
+            rows += int(summary.get("added-records") or 0)
+            bytes_written += int(summary.get("added-files-size") or 0)
+            files += int(summary.get("added-data-files") or 0)
+        stage.rows, stage.bytes_written, stage.files = rows, bytes_written, files
 
     def _get_catalog(self):
         """Lazy load Iceberg catalog"""
-        if self._catalog:
-            return self._catalog
-
+        with self._catalog_lock:
+            if self._catalog:
+                return self._catalog
+            return self._load_catalog()
+
+    def reset_catalog(self) -> None:
+        """Drop the cached catalog so the next use re-creates it"""
+        with self._catalog_lock:
+            self._catalog = None
+
+    def check_catalog(self) -> None:
+        """Raise if the Iceberg catalog is unreachable"""
+        self._get_catalog().list_namespaces()
+
+    def _load_catalog(self):
+        """Create the Iceberg catalog from configuration"""
         try:
-            bucket_name = self.config.s3_bucket
-
             # Catalog URI (for SQL catalog type)
-            uri = (
+            uri = self.config.catalog_uri or (
                 f"postgresql://{self.config.source_user}:{self.config.source_password}"
                 f"@{self.config.source_host}:{self.config.source_port}/{self.config.source_db}"
             )
@@ -360,7 +1287,7 @@ class IcebergTableManager:
             if not endpoint.startswith("http://") and not endpoint.startswith("https://"):
                 endpoint = f"http://{endpoint}"
 
-            warehouse = f"s3a://{bucket_name}/warehouse"
+            warehouse = self.config.storage_uri("warehouse", scheme="s3a")
             logger.info(f"Initializing Iceberg catalog with warehouse: {warehouse}")
 
             self._catalog = load_catalog(
@@ -381,23 +1308,97 @@ class IcebergTableManager:
             logger.error(f"Failed to load Iceberg catalog: {e}")
             raise
 
+    def get_parquet_settings(self, table_def: TableDefinition) -> Dict[str, Any]:
+        """Resolve Parquet output settings, table-level values winning over globals"""
+        return {
+            "target_file_size_bytes": (
+                table_def.target_file_size_bytes or self.config.parquet_target_file_size_bytes
+            ),
+            "row_group_size": table_def.row_group_size or self.config.parquet_row_group_size,
+            "compression": table_def.compression or self.config.parquet_compression,
+            "compression_level": (
+                table_def.compression_level or self.config.parquet_compression_level
+            ),
+        }
+
+    def get_table_properties(self, table_def: TableDefinition) -> Dict[str, str]:
+        """Iceberg table properties describing how the table's files are written"""
+        settings = self.get_parquet_settings(table_def)
+        properties = {"write.format.default": "parquet"}
+        if settings["target_file_size_bytes"]:
+            properties["write.target-file-size-bytes"] = str(settings["target_file_size_bytes"])
+        if settings["row_group_size"]:
+            properties["write.parquet.row-group-limit"] = str(settings["row_group_size"])
+        if settings["compression"]:
+            properties["write.parquet.compression-codec"] = settings["compression"].lower()
+        if settings["compression_level"]:
+            properties["write.parquet.compression-level"] = str(settings["compression_level"])
+        return properties
+
+    def get_copy_options(self, table_def: TableDefinition) -> str:
+        """Extra COPY options for the table's compression and row-group settings"""
+        settings = self.get_parquet_settings(table_def)
+        options = ""
+        if settings["compression"]:
+            options += f", COMPRESSION '{settings['compression']}'"
+        if settings["compression_level"]:
+            options += f", COMPRESSION_LEVEL {settings['compression_level']}"
+        if settings["row_group_size"]:
+            options += f", ROW_GROUP_SIZE {settings['row_group_size']}"
+        return options
+
     def create_or_get_table(self, table_def: TableDefinition, schema: Schema):
         """Create or retrieve existing Iceberg table"""
         catalog = self._get_catalog()
-        catalog.create_namespace_if_not_exists(self.config.iceberg_namespace)
+        with self._catalog_lock:
+            catalog.create_namespace_if_not_exists(self.config.iceberg_namespace)
 
-        table_location = (
-            f"s3a://{self.config.s3_bucket}/warehouse/"
-            f"{self.config.iceberg_namespace}.db/{table_def.name}"
+        table_location = self.config.storage_uri(
+            f"warehouse/{self.config.iceberg_namespace}.db/{table_def.name}", scheme="s3a"
         )
 
+        partition_spec = SchemaConverter.table_definition_to_partition_spec(table_def, schema)
+        sort_order = SchemaConverter.table_definition_to_sort_order(table_def, schema)
+        properties = self.get_table_properties(table_def)
+
         try:
             table = catalog.create_table_if_not_exists(
                 identifier=(self.config.iceberg_namespace, table_def.name),
                 schema=schema,
                 location=table_location,
-                properties={"write.format.default": "parquet"},
+                partition_spec=partition_spec,
+                sort_order=sort_order,
+                properties=properties,
             )
+
+            # Keep write properties in sync with the configuration
+            changed = {k: v for k, v in properties.items() if table.properties.get(k) != v}
+            if changed:
+                logger.info(f"Updating table properties of {table_def.name}: {changed}")
+                with table.transaction() as transaction:
+                    transaction.set_properties(**changed)
+
+            # Tables created before partitioning was configured are evolved
+            if partition_spec.fields and table.spec().is_unpartitioned():
+                logger.info(f"Adding partition spec to {table_def.name}: {table_def.partition_field}")
+                with table.update_spec() as update:
+                    for spec_field in partition_spec.fields:
+                        update.add_field(
+                            schema.find_column_name(spec_field.source_id),
+                            spec_field.transform,
+                            spec_field.name
+                        )
+                table.refresh()
+
+            # Declare the configured sort order (new data files follow it)
+            sort_columns = table_def.sort_by if sort_order.fields else []
+            if self.sort_columns(table) != sort_columns:
+                logger.info(f"Setting sort order of {table_def.name}: {sort_columns}")
+                with table.update_sort_order() as update:
+                    for column in sort_columns:
+                        update.asc(column, IdentityTransform(), NullOrder.NULLS_LAST)
+                table.refresh()
+
             logger.info(f"Table ready: {self.config.iceberg_namespace}.{table_def.name}")
             return table
         except Exception as e:
@@ -405,62 +1406,794 @@ class IcebergTableManager:
             raise
 
     @staticmethod
-    def get_existing_files(table) -> set:
-        """Get set of data files already in the table"""
-        existing = set()
+    def sort_columns(table) -> List[str]:
+        """Columns of the table's current sort order"""
+        schema = table.schema()
+        return [schema.find_column_name(f.source_id) for f in table.sort_order().fields]
+
+    @staticmethod
+    def evolve_schema(table, table_def: TableDefinition, schema: Schema) -> List[str]:
+        """Add columns present in the definition (e.g. hash columns) to the table
+
+        Returns the added column names; existing rows read them as NULL.
+        """
+        added = [f.name for f in schema.fields if f.name not in table.schema().column_names]
+        if added:
+            logger.info(f"Adding columns to {table_def.name}: {added}")
+            with table.update_schema() as update:
+                update.union_by_name(schema)
+            table.refresh()
+        return added
+
+    @staticmethod
+    def export_to_parquet(
+        connection,
+        query: str,
+        output_path: str,
+        options: str = "",
+        stage: Optional[StageMetrics] = None
+    ) -> List[str]:
+        """Run a Parquet COPY and return the files it wrote
+
+        RETURN_FILES reports the written paths as COPY metadata, so the
+        exported data never has to be read back to discover them. Their
+        sizes come from read_blob, which only stats the files (local or
+        object storage) when the content column is not selected.
+        """
+        if "://" not in output_path:
+            # Local storage root: DuckDB does not create parent directories
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        result = connection.execute(f"""
+            COPY ({query}) TO '{output_path}' (FORMAT PARQUET, RETURN_FILES true{options})
+        """).fetchone()
+        files = list(result[1]) if result and result[1] else []
+        rows = result[0] if result else 0
+        bytes_written = 0
+        if files:
+            bytes_written = connection.execute(
+                "SELECT sum(size) FROM read_blob(?)", [files]
+            ).fetchone()[0] or 0
+        logger.info(f"Exported {rows} rows ({bytes_written} bytes) to {len(files)} file(s)")
+        if stage:
+            stage.add(rows=rows, bytes_written=bytes_written, files=len(files))
+        return files
+
+    def export_table_query(
+        self,
+        connection,
+        table_def: TableDefinition,
+        query: str,
+        output_name: str,
+        stage: Optional[StageMetrics] = None
+    ) -> List[str]:
+        """Export a source query for a table, partitioned when configured
+
+        Partitioned tables are written Hive-style with PARTITION_BY on a
+        derived column (e.g. interval_start_day), which keeps the source
+        column in the files so Iceberg can infer partition values from the
+        column statistics.
+        """
+        base_path = self.config.storage_uri(f"{table_def.name}/{output_name}")
+
+        settings = self.get_parquet_settings(table_def)
+        options = self.get_copy_options(table_def)
+
+        if not table_def.partition_field:
+            if settings["target_file_size_bytes"]:
+                # File rolling writes data_<n>.parquet files into a directory
+                logger.info(f"Exporting data to {base_path}/")
+                return self.export_to_parquet(
+                    connection, query, base_path,
+                    f"{options}, FILE_SIZE_BYTES {settings['target_file_size_bytes']}", stage
+                )
+            output_path = f"{base_path}.parquet"
+            logger.info(f"Exporting data to {output_path}")
+            return self.export_to_parquet(connection, query, output_path, options, stage)
+
+        if settings["target_file_size_bytes"]:
+            # DuckDB cannot combine file rotation with PARTITION_BY; files are
+            # bounded by partition (and extraction range) instead
+            logger.info(f"target_file_size_bytes is not applied to partitioned export of {table_def.name}")
+
+        column = SchemaConverter.partition_column_name(table_def.partition_field)
+        expression = SchemaConverter.partition_expression(table_def.partition_field)
+        partitioned_query = f"SELECT *, {expression} AS {column} FROM ({query}) AS src"
+        logger.info(f"Exporting partitioned data to {base_path}/{column}=*/")
+        return self.export_to_parquet(
+            connection, partitioned_query, base_path, f"{options}, PARTITION_BY ({column})", stage
+        )
+
+    @staticmethod
+    def is_load_committed(table, load_id: str) -> bool:
+        """Check whether a load ID was already committed to the table
+
+        Only snapshot summaries from the table metadata are inspected; no
+        manifest or data file is read, so the cost does not grow with the
+        number of files in the table. The ancestry of the current snapshot
+        is walked newest first, where a retried load's commit sits, and the
+        walk stops at the first match; snapshots that were rolled back are
+        not part of the table and do not count.
+        """
+        # Snapshots are listed in commit order, so each parent precedes its
+        # child; following parent IDs down the list avoids snapshot_by_id,
+        # which scans the whole list for every ancestor
+        ancestor_id = table.metadata.current_snapshot_id
+        for snapshot in reversed(table.metadata.snapshots):
+            if ancestor_id is None:
+                break
+            if snapshot.snapshot_id != ancestor_id:
+                continue
+            if snapshot.summary and snapshot.summary.get(LOAD_ID_PROPERTY) == load_id:
+                return True
+            ancestor_id = snapshot.parent_snapshot_id
+        return False
+
+    def commit_files(
+        self,
+        table,
+        files: List[str],
+        load_id: str,
+        max_attempts: int = 3,
+        stage: Optional[StageMetrics] = None
+    ) -> bool:
+        """Add exported files to the table in one snapshot tagged with the load ID
+
+        Files are named after their load ID, so a load that is already
+        recorded in a snapshot summary is never added twice, e.g. when a
+        commit succeeded but its response was lost. Returns False when the
+        load had already been committed.
+        """
+        for attempt in range(1, max_attempts + 1):
+            if stage:
+                stage.retries = attempt - 1
+            if self.is_load_committed(table, load_id):
+                logger.info(f"Load {load_id} already committed (table up to date)")
+                return False
+            try:
+                table.add_files(
+                    files,
+                    snapshot_properties=self.snapshot_properties(load_id),
+                    check_duplicate_files=False
+                )
+                if stage:
+                    self.record_snapshots(stage, table, load_id)
+                return True
+            except Exception as e:
+                if attempt == max_attempts:
+                    raise
+                logger.warning(f"Commit attempt {attempt} for load {load_id} failed: {e}")
+                table.refresh()
+        return False
+
+    def commit_progress(self, table, load_id: str) -> None:
+        """Commit a snapshot without data files, carrying the load's properties"""
+        with table.transaction() as transaction:
+            with transaction.update_snapshot(
+                snapshot_properties=self.snapshot_properties(load_id)
+            ).fast_append():
+                pass
+
+    def source_relation(self, table_def: TableDefinition) -> str:
+        """FROM clause of a table's source (its source_query or schema table) for probes"""
+        if table_def.source_query:
+            return f"({table_def.source_query}) AS src"
+        return f"{self.config.source_schema}.{table_def.name}"
+
+    def get_incremental_window(
+        self,
+        table_def: TableDefinition,
+        connection,
+        state_manager: StateManagerInterface
+    ) -> Optional[Tuple[Any, Any]]:
+        """Determine the (watermark, run_high_water] window for an incremental load
+
+        The high-water mark is probed with the window predicate pushed into the
+        source scan, so only rows newer than the watermark are read. Returns
+        None when the source has nothing beyond the stored watermark. The
+        watermark is None for a table that was never loaded; the window then
+        has no lower bound, whatever the type of the incremental field.
+        """
+        field_name = table_def.incremental_field
+        field_type = next(
+            (f.type for f in table_def.fields if f.name == field_name),
+            FieldType.TIMESTAMP
+        )
+
+        with self._state_lock:
+            watermark, _ = state_manager.get_last_processed_value(table_def.name, field_name)
+        source = self.source_relation(table_def)
+        where = ""
+        if watermark is not None:
+            where = f"WHERE {field_name} > {SchemaConverter.to_sql_literal(watermark, field_type)}"
+
+        high_water = connection.execute(f"""
+            SELECT max({field_name}) FROM {source}
+            {where}
+        """).fetchone()[0]
+
+        if high_water is None:
+            return None
+
+        logger.info(f"Incremental window for {table_def.name}: ({watermark}, {high_water}]")
+        return watermark, high_water
+
+    def plan_ranges(
+        self,
+        table_def: TableDefinition,
+        connection,
+        split_field: str,
+        num_ranges: int,
+        predicate: Optional[str] = None
+    ) -> List[str]:
+        """Split a table into range predicates on split_field
+
+        Numeric and temporal fields are cut into equal-width ranges between
+        their min and max; other types use quantile probes. Probes honour the
+        given predicate, so incremental loads only split the new delta. The
+        first range also picks up NULLs in the split field.
+        """
+        field_type = next(
+            (f.type for f in table_def.fields if f.name == split_field),
+            FieldType.STRING
+        )
+
+        source = self.source_relation(table_def)
+        where = f"WHERE {predicate}" if predicate else ""
+
+        if field_type in (FieldType.STRING, FieldType.BOOLEAN):
+            fractions = [i / num_ranges for i in range(1, num_ranges)]
+            boundaries = connection.execute(f"""
+                SELECT quantile_disc({split_field}, {fractions}) FROM {source} {where}
+            """).fetchone()[0] or []
+        else:
+            low, high = connection.execute(f"""
+                SELECT min({split_field}), max({split_field}) FROM {source} {where}
+            """).fetchone()
+            if low is None or high is None:
+                return []
+            if field_type in (FieldType.INTEGER, FieldType.LONG):
+                boundaries = [low + (high - low) * i // num_ranges for i in range(1, num_ranges)]
+            else:
+                boundaries = [low + (high - low) * i / num_ranges for i in range(1, num_ranges)]
+
+        # Drop duplicate cut points (skewed or narrow ranges)
+        boundaries = sorted(set(b for b in boundaries if b is not None))
+
+        ranges = []
+        edges = [None] + boundaries + [None]
+        for lower, upper in zip(edges, edges[1:]):
+            conditions = []
+            if lower is not None:
+                conditions.append(f"{split_field} >= {SchemaConverter.to_sql_literal(lower, field_type)}")
+            if upper is not None:
+                conditions.append(f"{split_field} < {SchemaConverter.to_sql_literal(upper, field_type)}")
+            range_predicate = " AND ".join(conditions) or "TRUE"
+            if lower is None:
+                range_predicate = f"({range_predicate} OR {split_field} IS NULL)"
+            ranges.append(range_predicate)
+
+        logger.info(f"Planned {len(ranges)} extraction ranges on {table_def.name}.{split_field}")
+        return ranges
+
+    def plan_chunks(
+        self,
+        table_def: TableDefinition,
+        connection,
+        predicate: Optional[str] = None
+    ) -> List[str]:
+        """Split a load into range predicates of roughly chunk_rows rows each
+
+        The rows matching the predicate are counted and cut into that many
+        ranges on the split field (see plan_ranges), so chunks are only as
+        even as the field's distribution. Returns no chunks when the load
+        fits in one or the table has no split field.
+        """
+        chunk_rows = table_def.chunk_rows or self.config.load_chunk_rows
+        split_field = (
+            table_def.split_field or table_def.incremental_field or table_def.primary_key
+        )
+        if not split_field:
+            logger.info(f"{table_def.name} has no split field, loading without chunks")
+            return []
+
+        where = f"WHERE {predicate}" if predicate else ""
+        rows = connection.execute(
+            f"SELECT count(*) FROM {self.source_relation(table_def)} {where}"
+        ).fetchone()[0]
+        num_chunks = -(-rows // chunk_rows)
+        if num_chunks <= 1:
+            return []
+
+        chunks = self.plan_ranges(table_def, connection, split_field, num_chunks, predicate)
+        return chunks if len(chunks) > 1 else []
+
+    @staticmethod
+    def latest_checkpoint(table) -> Optional[Dict[str, Any]]:
+        """Checkpoint of the newest loader commit, or None if it was not chunked
+
+        Maintenance commits (no run ID) are skipped unless they carry the
+        checkpoint forward.
+        """
+        for snapshot in ancestors_of(table.current_snapshot(), table.metadata):
+            summary = snapshot.summary
+            if summary is None:
+                continue
+            checkpoint = summary.get(CHECKPOINT_PROPERTY)
+            if checkpoint is not None:
+                return json.loads(checkpoint)
+            if summary.get(RUN_ID_PROPERTY) is not None:
+                return None
+        return None
+
+    def pending_checkpoint(
+        self,
+        table,
+        table_def: TableDefinition,
+        state_manager: Optional[StateManagerInterface]
+    ) -> Optional[Dict[str, Any]]:
+        """Checkpoint of an interrupted chunked load of the table, if any
+
+        An incremental checkpoint is pending while the stored watermark is
+        still the start of its window: chunks are left, or all are committed
+        but the watermark was not saved after them.
+        """
+        checkpoint = self.latest_checkpoint(table)
+        if checkpoint is None:
+            return None
+        if checkpoint["field"] is None:
+            return checkpoint if checkpoint["done"] < len(checkpoint["chunks"]) else None
+        if not (table_def.is_incremental and state_manager) or \
+                checkpoint["field"] != table_def.incremental_field:
+            return None
+        with self._state_lock:
+            watermark, _ = state_manager.get_last_processed_value(table_def.name, checkpoint["field"])
+        start = None if watermark is None else str(watermark)
+        return checkpoint if start == checkpoint["start"] else None
+
+    @contextmanager
+    def source_query(self, table_def: TableDefinition, connection, predicate: Optional[str] = None):
+        """Yield the extraction query of a table on the given connection
+
+        With source_engine 'binary_copy' the predicate is pushed into the
+        COPY query and its Arrow stream is registered on the connection for
+        the duration of the block; the query then reads that stream.
+        """
+        if table_def.source_engine != "binary_copy":
+            yield SchemaConverter.generate_source_query(
+                table_def, self.config.source_schema, predicate
+            )
+            return
+
+        if not isinstance(self.data_source, ArrowSourceInterface):
+            raise ValueError(
+                f"{type(self.data_source).__name__} cannot read {table_def.name} "
+                f"with source_engine 'binary_copy'"
+            )
+        reader = self.data_source.read_arrow(table_def, self.config.source_schema, predicate)
+        relation = f"binary_copy_{table_def.name}_{uuid.uuid4().hex[:8]}"
+        connection.register(relation, reader)
         try:
-            scan = table.scan()
-            for task in scan.plan_files():
-                existing.add(task.file.file_path)
-            logger.info(f"Found {len(existing)} existing files in table")
-        except Exception as e:
-            logger.warning(f"Could not scan existing files: {e}")
-        return existing
+            yield SchemaConverter.generate_source_query(
+                table_def, self.config.source_schema, source_relation=relation
+            )
+        finally:
+            connection.unregister(relation)
+            reader.close()
+
+    def export_ranges_parallel(
+        self,
+        table_def: TableDefinition,
+        connection,
+        ranges: List[str],
+        output_prefix: str,
+        predicate: Optional[str] = None,
+        stage: Optional[StageMetrics] = None
+    ) -> List[str]:
+        """Export each range to its own Parquet file over a pool of connections"""
+
+        def export_range(index: int, range_predicate: str) -> List[str]:
+            combined = f"({predicate}) AND ({range_predicate})" if predicate else range_predicate
+            output_name = f"{output_prefix}-{table_def.name}-{index:04d}"
+            worker = self.data_source.create_worker_connection(connection)
+            try:
+                with self.source_query(table_def, worker, combined) as query:
+                    files = self.export_table_query(worker, table_def, query, output_name, stage)
+            finally:
+                worker.close()
+            logger.info(f"Exported range {index + 1}/{len(ranges)} ({output_name})")
+            return files
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [
+                executor.submit(export_range, index, range_predicate)
+                for index, range_predicate in enumerate(ranges)
+            ]
+            return [path for future in futures for path in future.result()]
+
+    def advance_watermark(
+        self,
+        table_def: TableDefinition,
+        state_manager: StateManagerInterface,
+        window: Tuple[Any, Any]
+    ) -> None:
+        """Record a committed incremental window as the table's new watermark"""
+        if state_manager.commits_with_data:
+            # Already part of the data commit (see watermark_properties)
+            return
+        start, end = window
+        # Serialise read-modify-write of the shared state across table workers
+        with self._state_lock:
+            state = state_manager.get_state()
+            state[f"{table_def.name}_window"] = {
+                "field": table_def.incremental_field,
+                "start": None if start is None else str(start),
+                "end": str(end),
+                "updated_at": datetime.utcnow().isoformat(),
+            }
+            state_manager.save_state(state)
+
+    def merge_rows(
+        self,
+        table,
+        table_def: TableDefinition,
+        schema: Schema,
+        connection,
+        query: str,
+        load_id: str,
+        full_refresh: bool = False,
+        stage: Optional[StageMetrics] = None
+    ) -> None:
+        """Upsert changed rows into the table on its primary key
+
+        pyiceberg rewrites only the data files holding matched keys
+        (copy-on-write), so the raw table stays the size of the source. A
+        full refresh (first merge load) replaces the table contents instead,
+        collapsing any history appended before merge mode was enabled.
+        """
+        if not table_def.primary_key:
+            raise ValueError(f"Merge load of {table_def.name} requires a primary_key")
+
+        rows = connection.execute(query).arrow()
+        if hasattr(rows, "read_all"):
+            rows = rows.read_all()
+        rows = rows.cast(schema.as_arrow())
+        if stage:
+            stage.rows = rows.num_rows
+        if rows.num_rows == 0:
+            logger.info(f"No changed rows to merge into {table_def.name}")
+            return
+        if self.is_load_committed(table, load_id):
+            logger.info(f"Load {load_id} already committed (table up to date)")
+            return
+
+        snapshot_properties = self.snapshot_properties(load_id)
+        if full_refresh:
+            logger.info(f"Replacing {table_def.name} with {rows.num_rows} rows")
+            table.overwrite(rows, snapshot_properties=snapshot_properties)
+        else:
+            result = table.upsert(
+                rows,
+                join_cols=[table_def.primary_key],
+                snapshot_properties=snapshot_properties
+            )
+            logger.info(
+                f"Merged {table_def.name}: {result.rows_updated} updated, "
+                f"{result.rows_inserted} inserted"
+            )
+        if stage:
+            rows_read = stage.rows
+            self.record_snapshots(stage, table, load_id)
+            stage.rows = rows_read
 
-    def load_table(self, table_def: TableDefinition, connection) -> None:
-        """Load a table from source to Iceberg"""
+    def append_arrow_stream(
+        self,
+        table,
+        table_def: TableDefinition,
+        schema: Schema,
+        connection,
+        query: str,
+        load_id: str,
+        stage: Optional[StageMetrics] = None
+    ) -> int:
+        """Stream query results as Arrow batches into the table via pyiceberg
+
+        Batches are buffered up to config.arrow_chunk_bytes, cast once to the
+        Iceberg schema and appended, so memory stays bounded regardless of
+        table size. pyiceberg writes the files itself (field IDs and column
+        statistics included). All chunks are staged in one transaction, so
+        the load commits atomically as a single unit. Returns the row count.
+        """
+        if self.is_load_committed(table, load_id):
+            logger.info(f"Load {load_id} already committed (table up to date)")
+            return 0
+
+        arrow_schema = schema.as_arrow()
+        reader = connection.execute(query).fetch_record_batch(self.config.arrow_batch_rows)
+
+        total_rows = 0
+        chunks = 0
+        pending: List[pa.RecordBatch] = []
+        pending_bytes = 0
+        with table.transaction() as transaction:
+            def flush():
+                nonlocal chunks, total_rows
+                chunk = pa.Table.from_batches(pending).cast(arrow_schema)
+                transaction.append(chunk, snapshot_properties=self.snapshot_properties(load_id))
+                chunks += 1
+                total_rows += chunk.num_rows
+                pending.clear()
+
+            for batch in reader:
+                if batch.num_rows == 0:
+                    continue
+                pending.append(batch)
+                pending_bytes += batch.nbytes
+                if pending_bytes >= self.config.arrow_chunk_bytes:
+                    flush()
+                    pending_bytes = 0
+            if pending:
+                flush()
+
+        logger.info(f"Appended {total_rows} rows to {table_def.name} in {chunks} chunk(s)")
+        if stage:
+            self.record_snapshots(stage, table, load_id)
+        return total_rows
+
+    def load_table(
+        self,
+        table_def: TableDefinition,
+        connection,
+        state_manager: Optional[StateManagerInterface] = None
+    ) -> None:
+        """Load a table from source to Iceberg
+
+        Incremental tables (is_incremental with an incremental_field) only
+        export rows inside the (watermark, run_high_water] window when a state
+        manager is given; the watermark is advanced after the Iceberg commit,
+        or written in it when the state manager commits_with_data.
+        Tables with load_mode 'merge' upsert those rows on their primary key
+        instead of appending files; write_engine 'arrow' streams rows through
+        pyiceberg's writer instead of DuckDB COPY. Append loads larger than
+        chunk_rows are committed chunk by chunk (see load_chunks), and an
+        interrupted chunked load is finished before a new one starts. Each
+        stage is timed and counted in self.metrics.
+        """
         logger.info(f"{'='*80}")
         logger.info(f"Loading table: {table_def.name}")
         logger.info(f"{'='*80}")
 
+        def stage(name: str):
+            return self.metrics.stage(table_def.name, name)
+
         # Convert table definition to Iceberg schema
         schema = SchemaConverter.table_definition_to_schema(table_def)
 
         # Create or get table
-        table = self.create_or_get_table(table_def, schema)
-
-        # Generate query
-        query = SchemaConverter.generate_source_query(table_def, self.config.source_schema)
+        with stage("schema"):
+            table = self.create_or_get_table(table_def, schema)
+            added_columns = self.evolve_schema(table, table_def, schema)
+
+        # Finish an interrupted chunked load; newer rows follow on the next run
+        if table_def.load_mode != "merge":
+            checkpoint = self.pending_checkpoint(table, table_def, state_manager)
+            if checkpoint:
+                self.load_chunks(table, table_def, schema, connection, state_manager, checkpoint)
+                return
+
+        # Merge tables are reloaded in full to populate newly added columns
+        reload = bool(added_columns) and table_def.load_mode == "merge"
+
+        # Resolve incremental window
+        window = None
+        predicate = None
+        if table_def.is_incremental and table_def.incremental_field and state_manager:
+            with stage("window"):
+                window = self.get_incremental_window(table_def, connection, state_manager)
+            if window is None and not reload:
+                logger.info(f"No new rows in {table_def.name} since last watermark")
+                return
+
+            field_type = next(
+                (f.type for f in table_def.fields if f.name == table_def.incremental_field),
+                FieldType.TIMESTAMP
+            )
+            if window and reload:
+                logger.info(f"Reloading {table_def.name} to populate {added_columns}")
+                predicate = (
+                    f"{table_def.incremental_field} <= "
+                    f"{SchemaConverter.to_sql_literal(window[1], field_type)}"
+                )
+            elif window:
+                start, end = window
+                predicate = (
+                    f"{table_def.incremental_field} <= {SchemaConverter.to_sql_literal(end, field_type)}"
+                )
+                if start is not None:
+                    predicate = (
+                        f"{table_def.incremental_field} > {SchemaConverter.to_sql_literal(start, field_type)} "
+                        f"AND {predicate}"
+                    )
+
+        if table_def.load_mode != "merge" and (table_def.chunk_rows or self.config.load_chunk_rows):
+            with stage("plan_chunks"):
+                chunks = self.plan_chunks(table_def, connection, predicate)
+            if chunks:
+                checkpoint = {
+                    "id": str(uuid.uuid4()),
+                    "field": table_def.incremental_field if window else None,
+                    "start": str(window[0]) if window and window[0] is not None else None,
+                    "end": str(window[1]) if window else None,
+                    "predicate": predicate,
+                    "chunks": chunks,
+                    "done": 0,
+                }
+                self.load_chunks(table, table_def, schema, connection, state_manager, checkpoint)
+                return
 
-        # Export to S3
-        output_path = f"s3://{self.config.s3_bucket}/{table_def.name}/{uuid.uuid4()}-{table_def.name}.parquet"
+        # Exported files are named after the load ID used to tag the commit
+        load_id = str(uuid.uuid4())
+        if window:
+            self._load_properties[load_id] = state_manager.watermark_properties(table_def, window)
+        try:
+            self._load_and_commit(
+                table, table_def, schema, connection, state_manager,
+                window, predicate, reload, load_id
+            )
+        finally:
+            self._load_properties.pop(load_id, None)
 
-        if table_def.partition_field:
-            # Partitioned export
-            output_path = f"s3://{self.config.s3_bucket}/{table_def.name}/{table_def.partition_field}=*/*.parquet"
-            logger.info(f"Exporting partitioned data to {output_path}")
+    def _load_and_commit(
+        self,
+        table,
+        table_def: TableDefinition,
+        schema: Schema,
+        connection,
+        state_manager: Optional[StateManagerInterface],
+        window: Optional[Tuple[Any, Any]],
+        predicate: Optional[str],
+        reload: bool,
+        load_id: str
+    ) -> None:
+        """Extract and commit one load of a table, then advance its watermark"""
+        def stage(name: str):
+            return self.metrics.stage(table_def.name, name)
+
+        if table_def.load_mode == "merge":
+            full_refresh = reload or window is None or window[0] is None
+            with stage("merge") as metrics, \
+                    self.source_query(table_def, connection, predicate) as query:
+                self.merge_rows(
+                    table, table_def, schema, connection, query, load_id, full_refresh, metrics
+                )
         else:
-            logger.info(f"Exporting data to {output_path}")
+            self._append(table, table_def, schema, connection, predicate, load_id)
 
-        connection.execute(f"""
-            COPY ({query}) TO '{output_path}' (FORMAT PARQUET)
-        """)
+        # Only move the watermark once the data is committed
+        if window:
+            with stage("watermark"):
+                self.advance_watermark(table_def, state_manager, window)
 
-        # Get files and add to table
-        result = connection.sql(f"""
-            SELECT distinct filename FROM read_parquet('{output_path}', filename = true);
-        """).fetchall()
-        files = [row[0] for row in result]
+    def _append(
+        self,
+        table,
+        table_def: TableDefinition,
+        schema: Schema,
+        connection,
+        predicate: Optional[str],
+        load_id: str
+    ) -> None:
+        """Extract the rows matching predicate and append them in one snapshot"""
+        def stage(name: str):
+            return self.metrics.stage(table_def.name, name)
+
+        if table_def.write_engine == "arrow":
+            with stage("arrow_append") as metrics, \
+                    self.source_query(table_def, connection, predicate) as query:
+                self.append_arrow_stream(
+                    table, table_def, schema, connection, query, load_id, metrics
+                )
+            return
 
-        existing = self.get_existing_files(table)
-        new_files = [f for f in files if f not in existing]
+        # Parallel range extraction
+        num_ranges = self.resources.max_ranges(
+            table_def.parallel_ranges or self.config.extract_parallelism, table_def
+        )
+        split_field = (
+            table_def.split_field or table_def.incremental_field or table_def.primary_key
+        )
+        ranges = []
+        if num_ranges > 1 and split_field:
+            with stage("plan_ranges"):
+                ranges = self.plan_ranges(
+                    table_def, connection, split_field, num_ranges, predicate
+                )
 
-        if new_files:
-            logger.info(f"Adding {len(new_files)} new files to Iceberg table")
-            table.add_files(new_files)
+        # Every attempt exports under its own prefix: a retried chunk keeps its
+        # load ID, but must not write into the partial output of a failed attempt
+        output_prefix = f"{load_id}-{uuid.uuid4().hex[:8]}"
+        with stage("export") as metrics:
+            if len(ranges) > 1:
+                files = self.export_ranges_parallel(
+                    table_def, connection, ranges, output_prefix, predicate, metrics
+                )
+            else:
+                # Generate query and export to S3
+                with self.source_query(table_def, connection, predicate) as query:
+                    files = self.export_table_query(
+                        connection, table_def, query, f"{output_prefix}-{table_def.name}", metrics
+                    )
+
+        if files:
+            # All files of a run are committed in a single snapshot
+            logger.info(f"Adding {len(files)} new files to Iceberg table")
+            with stage("commit") as metrics:
+                self.commit_files(table, files, load_id, stage=metrics)
         else:
             logger.info(f"No new files to add (table up to date)")
 
+    def load_chunks(
+        self,
+        table,
+        table_def: TableDefinition,
+        schema: Schema,
+        connection,
+        state_manager: Optional[StateManagerInterface],
+        checkpoint: Dict[str, Any]
+    ) -> None:
+        """Append a load chunk by chunk, each in its own snapshot
+
+        Every chunk commit is tagged with the load ID <checkpoint id>-<index>
+        and records the checkpoint (window, chunk predicates and chunks done)
+        in its summary; the last one also carries the watermark when the
+        state manager commits_with_data, and the others repeat the previous
+        watermark, so it survives expiry of the snapshot that recorded it
+        while the load is pending. A load that fails part-way resumes
+        after the last committed chunk on the next run, so completed chunks
+        are neither extracted nor written again. The watermark only advances
+        once all chunks are committed.
+        """
+        def stage(name: str):
+            return self.metrics.stage(table_def.name, name)
+
+        chunks = checkpoint["chunks"]
+        window = (checkpoint["start"], checkpoint["end"]) if checkpoint["field"] else None
+        previous_watermark = {}
+        if window and state_manager.commits_with_data:
+            previous_watermark = IcebergSnapshotStateManager.latest_watermark(table)
+        if checkpoint["done"]:
+            logger.info(
+                f"Resuming {table_def.name} at chunk {checkpoint['done'] + 1}/{len(chunks)} "
+                f"(checkpoint {checkpoint['id']})"
+            )
+        else:
+            logger.info(f"Loading {table_def.name} in {len(chunks)} chunks (checkpoint {checkpoint['id']})")
+
+        for index in range(checkpoint["done"], len(chunks)):
+            load_id = f"{checkpoint['id']}-{index:04d}"
+            predicate = chunks[index]
+            if checkpoint["predicate"]:
+                predicate = f"({checkpoint['predicate']}) AND ({predicate})"
+
+            properties = {CHECKPOINT_PROPERTY: json.dumps({**checkpoint, "done": index + 1})}
+            if window and index == len(chunks) - 1:
+                properties.update(state_manager.watermark_properties(table_def, window))
+            else:
+                properties.update(previous_watermark)
+            self._load_properties[load_id] = properties
+            try:
+                self._append(table, table_def, schema, connection, predicate, load_id)
+                if not self.is_load_committed(table, load_id):
+                    # Empty chunk: its progress is still recorded
+                    with stage("commit"):
+                        self.commit_progress(table, load_id)
+            finally:
+                self._load_properties.pop(load_id, None)
+            logger.info(f"Committed chunk {index + 1}/{len(chunks)} of {table_def.name}")
+
+        if window:
+            with stage("watermark"):
+                self.advance_watermark(table_def, state_manager, window)
+
 
 # ============================================================================
 # Data Loader Orchestrator
@@ -482,29 +2215,556 @@ class GenericDataLoader:
         self.state_manager = state_manager
         self.table_manager = IcebergTableManager(config, data_source)
 
-    def load_all_tables(self) -> None:
-        """Load all defined tables"""
-        connection = None
+    def _load_table_worker(
+        self,
+        table_def: TableDefinition,
+        connection,
+        state_manager: Optional[StateManagerInterface]
+    ) -> TableLoadResult:
+        """Load one table on its own worker connection and capture the outcome"""
+        started = time.monotonic()
+        metrics = self.table_manager.metrics
+        resources = self.table_manager.resources
+        worker = None
+        # Connection setup counts as part of the table's load: a failure here
+        # fails this table only, not the whole run
+        try:
+            if resources.has_overrides(table_def):
+                # DuckDB settings are database-wide, so the table gets its own database
+                worker = self.data_source.create_isolated_connection()
+                if worker is None:
+                    logger.warning(
+                        f"{table_def.name}: data source has no isolated connections, "
+                        f"DuckDB settings of the table are ignored"
+                    )
+                else:
+                    resources.apply(worker, resources.table_settings(table_def))
+            if worker is None:
+                worker = self.data_source.create_worker_connection(connection)
+            self.table_manager.load_table(table_def, worker, state_manager)
+            return TableLoadResult(
+                table_def.name, True, time.monotonic() - started,
+                stages=metrics.table_stages(table_def.name)
+            )
+        except Exception as e:
+            logger.error(f"Failed to load table {table_def.name}: {e}")
+            return TableLoadResult(
+                table_def.name, False, time.monotonic() - started, str(e),
+                stages=metrics.table_stages(table_def.name)
+            )
+        finally:
+            if worker is not None:
+                worker.close()
+
+    def load_all_tables(self, connection=None) -> List[TableLoadResult]:
+        """Load all defined tables concurrently
+
+        Independent tables run on up to config.load_max_workers threads, each
+        with its own DuckDB connection, so the batch takes roughly as long as
+        the slowest table. Tables with DuckDB settings of their own run on an
+        isolated database (see ResourceGovernor). A failed table does not stop the others. Stage
+        metrics of the run are logged and written to the configured run
+        report and Prometheus textfile.
+
+        A given connection (service mode) is used and left open; otherwise
+        the data source is connected for this run and disconnected after it.
+        """
+        owns_connection = connection is None
+        results: Dict[str, TableLoadResult] = {}
+        metrics = LoadMetrics()
+        self.table_manager.metrics = metrics
+        logger.info(f"Loader run {metrics.run_id}")
         try:
-            connection = self.data_source.connect()
+            if owns_connection:
+                connection = self.data_source.connect()
+            resources = self.table_manager.resources
+            resources.apply(connection, resources.global_settings())
+
+            # Incremental tables need a state manager for their watermarks
+            state_manager = self.state_manager
+            if state_manager is None and any(t.is_incremental for t in self.table_definitions):
+                state_manager = S3StateManager(
+                    connection, self.config.s3_bucket, root=self.config.storage_root or None
+                )
+                if self.config.state_backend == "iceberg":
+                    # state.json is only read for tables without a snapshot watermark yet
+                    state_manager = IcebergSnapshotStateManager(
+                        self.table_manager, legacy=state_manager
+                    )
+
+            max_workers = resources.max_workers(
+                max(1, min(self.config.load_max_workers, len(self.table_definitions)))
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._load_table_worker, table_def, connection, state_manager)
+                    for table_def in self.table_definitions
+                ]
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[result.table_name] = result
 
-            for table_def in self.table_definitions:
-                try:
-                    self.table_manager.load_table(table_def, connection)
-                except Exception as e:
-                    logger.error(f"Failed to load table {table_def.name}: {e}")
-                    # Continue with other tables
+            report = [results[t.name] for t in self.table_definitions]
 
             logger.info(f"{'='*80}")
             logger.info("Data loading complete!")
-            logger.info(f"Loaded tables: {[t.name for t in self.table_definitions]}")
+            for result in report:
+                status = "OK" if result.success else f"FAILED ({result.error})"
+                logger.info(f"  {result.table_name}: {status} in {result.duration_seconds:.1f}s")
+                for m in result.stages:
+                    logger.info(
+                        f"    {m.stage}: {m.seconds:.2f}s, {m.rows} rows, "
+                        f"{m.bytes_written} bytes, {m.files} files, {m.retries} retries"
+                    )
             logger.info(f"{'='*80}")
 
+            metrics.write(
+                report, self.config.metrics_report_path, self.config.metrics_textfile_path
+            )
+            return report
+
         finally:
-            if connection:
+            if owns_connection and connection:
                 self.data_source.disconnect()
 
 
+# ============================================================================
+# Service Mode
+# ============================================================================
+
+class LoaderService:
+    """Run load cycles on a fixed interval in one long-lived process
+
+    The DuckDB connection (extensions loaded, source attached, S3 configured)
+    and the Iceberg catalog are created once and reused by every cycle. Both
+    are checked before each cycle, and after a cycle with failed tables, and
+    re-created when the check fails. An HTTP endpoint reports liveness for
+    container health checks.
+    """
+
+    def __init__(self, loader: GenericDataLoader, interval_seconds: int, health_port: int = 0):
+        self.loader = loader
+        self.interval_seconds = interval_seconds
+        self.health_port = health_port
+        self.connection = None
+        self.started_at = time.time()
+        self.cycles = 0
+        self.last_cycle: Dict[str, Any] = {}
+        self.last_success_at: Optional[float] = None
+        self._stop = threading.Event()
+        self._health_server = None
+
+    def ensure_connection(self):
+        """Return a working connection, reconnecting if the current one is broken"""
+        data_source = self.loader.data_source
+        if self.connection is not None:
+            try:
+                data_source.check_connection(self.connection)
+                return self.connection
+            except Exception as e:
+                logger.warning(f"Source connection unhealthy, reconnecting: {e}")
+                self.close_connection()
+        self.connection = data_source.connect()
+        logger.info("Source connection established")
+        return self.connection
+
+    def ensure_catalog(self) -> None:
+        """Re-create the Iceberg catalog when it is unreachable"""
+        table_manager = self.loader.table_manager
+        try:
+            table_manager.check_catalog()
+        except Exception as e:
+            logger.warning(f"Iceberg catalog unhealthy, re-creating: {e}")
+            table_manager.reset_catalog()
+            table_manager.check_catalog()
+
+    def close_connection(self) -> None:
+        try:
+            self.loader.data_source.disconnect()
+        except Exception as e:
+            logger.warning(f"Failed to close source connection: {e}")
+        self.connection = None
+
+    def run_cycle(self) -> List[TableLoadResult]:
+        """Run one load cycle on the warm connection and catalog"""
+        started = time.time()
+        self.cycles += 1
+        try:
+            connection = self.ensure_connection()
+            self.ensure_catalog()
+            results = self.loader.load_all_tables(connection)
+        except Exception as e:
+            logger.error(f"Load cycle {self.cycles} failed: {e}")
+            self.close_connection()
+            self.loader.table_manager.reset_catalog()
+            results = []
+            error = str(e)
+        else:
+            error = None
+            if not all(r.success for r in results):
+                # Failed tables may be due to a dropped connection or catalog
+                try:
+                    self.loader.data_source.check_connection(connection)
+                except Exception as e:
+                    logger.warning(f"Dropping source connection after failed tables: {e}")
+                    self.close_connection()
+                try:
+                    self.loader.table_manager.check_catalog()
+                except Exception as e:
+                    logger.warning(f"Dropping Iceberg catalog after failed tables: {e}")
+                    self.loader.table_manager.reset_catalog()
+
+        success = error is None and all(r.success for r in results)
+        if success:
+            self.last_success_at = time.time()
+        self.last_cycle = {
+            "cycle": self.cycles,
+            "run_id": self.loader.table_manager.metrics.run_id,
+            "started_at": datetime.utcfromtimestamp(started).isoformat(),
+            "duration_seconds": round(time.time() - started, 3),
+            "success": success,
+            "error": error,
+            "failed_tables": [r.table_name for r in results if not r.success],
+        }
+        return results
+
+    def health(self) -> Tuple[bool, Dict[str, Any]]:
+        """Healthy while cycles keep succeeding (or the first one is still due)
+
+        Health checks are answered from the state of the last cycle rather
+        than by querying the source, so they never contend with a running load.
+        """
+        now = time.time()
+        grace = 3 * self.interval_seconds
+        reference = self.last_success_at or self.started_at
+        healthy = now - reference <= grace
+        return healthy, {
+            "healthy": healthy,
+            "cycles": self.cycles,
+            "seconds_since_success": (
+                round(now - self.last_success_at, 1) if self.last_success_at else None
+            ),
+            "last_cycle": self.last_cycle,
+        }
+
+    def start_health_server(self) -> None:
+        """Serve GET /health on the health port in a background thread"""
+        service = self
+
+        class HealthHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") not in ("", "/health"):
+                    self.send_error(404)
+                    return
+                healthy, body = service.health()
+                payload = json.dumps(body).encode()
+                self.send_response(200 if healthy else 503)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                logger.debug(f"Health check: {format % args}")
+
+        self._health_server = ThreadingHTTPServer(("", self.health_port), HealthHandler)
+        threading.Thread(target=self._health_server.serve_forever, daemon=True).start()
+        logger.info(f"Health endpoint listening on port {self.health_port}")
+
+    def stop(self, *_) -> None:
+        """Finish the current cycle, then exit"""
+        logger.info("Stopping loader service after the current cycle")
+        self._stop.set()
+
+    def serve_forever(self, max_cycles: Optional[int] = None) -> None:
+        """Run cycles every interval_seconds until stopped (SIGTERM/SIGINT)"""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+        if self.health_port:
+            self.start_health_server()
+
+        logger.info(f"Loader service started, running every {self.interval_seconds}s")
+        try:
+            while not self._stop.is_set():
+                cycle_started = time.monotonic()
+                self.run_cycle()
+                if max_cycles and self.cycles >= max_cycles:
+                    break
+                # Cycles start on a fixed cadence; an overrunning cycle is followed immediately
+                delay = self.interval_seconds - (time.monotonic() - cycle_started)
+                self._stop.wait(max(0.0, delay))
+        finally:
+            self.close_connection()
+            if self._health_server:
+                self._health_server.shutdown()
+            logger.info(f"Loader service stopped after {self.cycles} cycle(s)")
+
+
+# ============================================================================
+# Table Maintenance
+# ============================================================================
+
+@dataclass
+class MaintenanceReport:
+    """Actions taken (or planned, for dry runs) on one table"""
+    table_name: str
+    dry_run: bool
+    compacted_input_files: int = 0
+    compacted_output_files: int = 0
+    expired_snapshots: int = 0
+    manifests_before: int = 0
+    manifests_after: int = 0
+    orphan_files: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+class IcebergTableMaintenance:
+    """Compaction, snapshot expiry, manifest rewrite and orphan file cleanup
+
+    Every loader commit adds a snapshot, a manifest and small files; this
+    keeps planning time in Trino and pyiceberg bounded.
+    """
+
+    ACTIONS = ("compact", "expire-snapshots", "rewrite-manifests", "remove-orphans")
+
+    def __init__(self, config: DatabaseConfig, table_manager: IcebergTableManager, connection):
+        self.config = config
+        self.table_manager = table_manager
+        self.connection = connection
+
+    @staticmethod
+    def _strip_scheme(path: str) -> str:
+        """Normalise s3://, s3a:// and file:// locations to bucket/key or a local path"""
+        return path.split("://", 1)[-1]
+
+    def _get_filesystem(self, location: str) -> Tuple[pafs.FileSystem, str]:
+        """Filesystem and path of a table prefix, for orphan detection
+
+        Resolved with FileSystem.from_uri, so a local storage_root (plain or
+        file:// paths) works as well as S3; S3 locations get the configured
+        endpoint and credentials as URI options.
+        """
+        if location.startswith(("s3://", "s3a://")):
+            endpoint = self.config.s3_endpoint
+            options = urlencode({
+                "endpoint_override": endpoint.split("://", 1)[-1],
+                "scheme": "https" if endpoint.startswith("https://") else "http",
+                "region": self.config.s3_region,
+            })
+            credentials = (
+                f"{quote(self.config.s3_access_key, safe='')}:"
+                f"{quote(self.config.s3_secret_key, safe='')}@"
+            )
+            location = f"s3://{credentials}{self._strip_scheme(location)}?{options}"
+        return pafs.FileSystem.from_uri(location)
+
+    def compact(self, table, table_def: TableDefinition, dry_run: bool = False) -> Tuple[int, int]:
+        """Bin-pack small data files of each partition into target-sized files
+
+        Files below 75% of the target size are grouped per partition of the
+        current spec and rewritten with DuckDB in the table's sort_by order;
+        the old files are replaced by the new ones in a single transaction.
+        """
+        target = int(
+            table.properties.get("write.target-file-size-bytes")
+            or self.config.parquet_target_file_size_bytes
+            or DEFAULT_TARGET_FILE_SIZE_BYTES
+        )
+        min_size = int(target * 0.75)
+        spec_id = table.spec().spec_id
+
+        groups: Dict[str, List[Any]] = {}
+        for task in table.scan().plan_files():
+            data_file = task.file
+            if data_file.spec_id == spec_id and data_file.file_size_in_bytes < min_size:
+                groups.setdefault(str(data_file.partition), []).append(data_file)
+
+        bins = []
+        for data_files in groups.values():
+            current, current_size = [], 0
+            for data_file in sorted(data_files, key=lambda f: f.file_size_in_bytes):
+                if current and current_size + data_file.file_size_in_bytes > target:
+                    bins.append(current)
+                    current, current_size = [], 0
+                current.append(data_file)
+                current_size += data_file.file_size_in_bytes
+            bins.append(current)
+        bins = [b for b in bins if len(b) > 1]
+
+        input_files = sum(len(b) for b in bins)
+        logger.info(f"{table_def.name}: {input_files} small files in {len(bins)} compaction groups")
+        if dry_run or not bins:
+            return input_files, len(bins)
+
+        load_id = str(uuid.uuid4())
+        options = self.table_manager.get_copy_options(table_def)
+        new_files = []
+        for index, data_files in enumerate(bins):
+            paths = [f.file_path for f in data_files]
+            output_path = self.config.storage_uri(
+                f"{table_def.name}/{load_id}-compacted-{index:04d}.parquet"
+            )
+            # hive_partitioning off: directory values are not table columns
+            query = SchemaConverter.apply_sort_order(
+                table_def,
+                f"SELECT * FROM read_parquet({paths}, union_by_name = true, hive_partitioning = false)"
+            )
+            new_files.extend(self.table_manager.export_to_parquet(
+                self.connection, query, output_path, options
+            ))
+
+        # Keep the loader watermark and checkpoint on the newest snapshot
+        properties = self.carried_properties(table)
+        with table.transaction() as transaction:
+            with transaction.update_snapshot(snapshot_properties=properties).overwrite() as overwrite:
+                for data_files in bins:
+                    for data_file in data_files:
+                        overwrite.delete_data_file(data_file)
+            transaction.add_files(
+                new_files,
+                snapshot_properties={LOAD_ID_PROPERTY: load_id, **properties},
+                check_duplicate_files=False
+            )
+        table.refresh()
+        return input_files, len(new_files)
+
+    @staticmethod
+    def carried_properties(table) -> Dict[str, str]:
+        """Loader state of the newest snapshots (watermark, chunk checkpoint) for a maintenance commit"""
+        properties = IcebergSnapshotStateManager.latest_watermark(table)
+        checkpoint = IcebergTableManager.latest_checkpoint(table)
+        if checkpoint is not None:
+            properties[CHECKPOINT_PROPERTY] = json.dumps(checkpoint)
+        return properties
+
+    def expire_snapshots(self, table, retention: timedelta, dry_run: bool = False) -> int:
+        """Expire snapshots older than the retention window (branch heads and tags are kept)"""
+        # Timezone-aware: pyiceberg reads a naive cutoff as UTC
+        cutoff = datetime.now(timezone.utc) - retention
+        cutoff_ms = int(cutoff.timestamp() * 1000)
+        # Snapshots referenced by a branch or tag are never expired
+        protected = {ref.snapshot_id for ref in table.metadata.refs.values()}
+        expired = [
+            s.snapshot_id for s in table.metadata.snapshots
+            if s.timestamp_ms < cutoff_ms and s.snapshot_id not in protected
+        ]
+        if expired and not dry_run:
+            table.maintenance.expire_snapshots().older_than(cutoff).commit()
+            table.refresh()
+        return len(expired)
+
+    def rewrite_manifests(self, table, dry_run: bool = False) -> Tuple[int, int]:
+        """Merge the current snapshot's manifests
+
+        pyiceberg has no dedicated rewrite action, so manifest merging is
+        enabled for an empty merge-append that consolidates them. The
+        table's own merge properties are restored in the same transaction,
+        so later loader commits behave as before.
+        """
+        snapshot = table.current_snapshot()
+        if snapshot is None:
+            return 0, 0
+        before = len(snapshot.manifests(table.io))
+        if before <= 1 or dry_run:
+            return before, before
+
+        merge_properties = {
+            "commit.manifest-merge.enabled": "true",
+            "commit.manifest.min-count-to-merge": "2",
+        }
+        previous = {key: table.properties.get(key) for key in merge_properties}
+        with table.transaction() as transaction:
+            transaction.set_properties(**merge_properties)
+            properties = self.carried_properties(table)
+            # The merge settings are read when the merge-append is created
+            with transaction.update_snapshot(snapshot_properties=properties).merge_append():
+                pass
+            restored = {key: value for key, value in previous.items() if value is not None}
+            if restored:
+                transaction.set_properties(**restored)
+            unset = [key for key, value in previous.items() if value is None]
+            if unset:
+                transaction.remove_properties(*unset)
+        table.refresh()
+        return before, len(table.current_snapshot().manifests(table.io))
+
+    def find_orphan_files(self, table, table_def: TableDefinition, older_than: timedelta) -> List[str]:
+        """Data files under the table's prefixes that no snapshot references
+
+        Covers the loader export prefix (<storage root>/<table>/) and the
+        table's own data directory. Files newer than older_than are skipped
+        so exports of in-flight loads are never touched. Orphans are
+        returned with the scheme of their prefix, ready for table.io.delete.
+        """
+        referenced = {
+            self._strip_scheme(path)
+            for path in table.inspect.all_files().column("file_path").to_pylist()
+        }
+        prefixes = [
+            self.config.storage_uri(table_def.name),
+            f"{table.location().rstrip('/')}/data",
+        ]
+        cutoff = (datetime.now(timezone.utc) - older_than).timestamp()
+
+        orphans = []
+        for prefix in prefixes:
+            filesystem, path = self._get_filesystem(prefix)
+            scheme = f"{prefix.split('://', 1)[0]}://" if "://" in prefix else ""
+            selector = pafs.FileSelector(path, recursive=True, allow_not_found=True)
+            for info in filesystem.get_file_info(selector):
+                if (
+                    info.type == pafs.FileType.File
+                    and info.path not in referenced
+                    and info.mtime is not None
+                    and info.mtime.timestamp() < cutoff
+                ):
+                    orphans.append(f"{scheme}{info.path}")
+        return orphans
+
+    def maintain_table(
+        self,
+        table_def: TableDefinition,
+        actions: Tuple[str, ...] = ACTIONS,
+        snapshot_retention: timedelta = timedelta(days=7),
+        orphan_older_than: timedelta = timedelta(days=3),
+        dry_run: bool = False
+    ) -> MaintenanceReport:
+        """Run the selected maintenance actions on one table"""
+        report = MaintenanceReport(table_name=table_def.name, dry_run=dry_run)
+        try:
+            schema = SchemaConverter.table_definition_to_schema(table_def)
+            table = self.table_manager.create_or_get_table(table_def, schema)
+
+            if "compact" in actions:
+                report.compacted_input_files, report.compacted_output_files = (
+                    self.compact(table, table_def, dry_run)
+                )
+            if "expire-snapshots" in actions:
+                report.expired_snapshots = self.expire_snapshots(table, snapshot_retention, dry_run)
+            if "rewrite-manifests" in actions:
+                report.manifests_before, report.manifests_after = (
+                    self.rewrite_manifests(table, dry_run)
+                )
+            if "remove-orphans" in actions:
+                report.orphan_files = self.find_orphan_files(table, table_def, orphan_older_than)
+                if not dry_run:
+                    for path in report.orphan_files:
+                        table.io.delete(path)
+        except Exception as e:
+            logger.error(f"Maintenance failed for {table_def.name}: {e}")
+            report.error = str(e)
+
+        logger.info(
+            f"{table_def.name}{' (dry run)' if dry_run else ''}: "
+            f"compacted {report.compacted_input_files} -> {report.compacted_output_files} files, "
+            f"expired {report.expired_snapshots} snapshots, "
+            f"manifests {report.manifests_before} -> {report.manifests_after}, "
+            f"{len(report.orphan_files)} orphan files"
+        )
+        return report
+
+
 # ============================================================================
 # Configuration from YAML/JSON (Optional Extension Point)
 # ============================================================================
@@ -529,6 +2789,15 @@ class ConfigLoader:
                 )
                 fields.append(field)
 
+            hash_columns = [
+                HashColumnDefinition(
+                    name=hash_config['name'],
+                    columns=hash_config['columns'],
+                    format=hash_config.get('format', 'hex')
+                )
+                for hash_config in table_config.get('hash_columns', [])
+            ]
+
             table_def = TableDefinition(
                 name=table_config['name'],
                 fields=fields,
@@ -536,7 +2805,24 @@ class ConfigLoader:
                 partition_field=table_config.get('partition_field'),
                 is_incremental=table_config.get('is_incremental', False),
                 incremental_field=table_config.get('incremental_field'),
-                primary_key=table_config.get('primary_key')
+                primary_key=table_config.get('primary_key'),
+                load_mode=table_config.get('load_mode', 'append'),
+                write_engine=table_config.get('write_engine', 'copy'),
+                source_engine=table_config.get('source_engine', 'scanner'),
+                parallel_ranges=table_config.get('parallel_ranges'),
+                split_field=table_config.get('split_field'),
+                chunk_rows=table_config.get('chunk_rows'),
+                target_file_size_bytes=table_config.get('target_file_size_bytes'),
+                row_group_size=table_config.get('row_group_size'),
+                compression=table_config.get('compression'),
+                compression_level=table_config.get('compression_level'),
+                hash_columns=hash_columns,
+                sort_by=table_config.get('sort_by', []),
+                sort_mode=table_config.get('sort_mode', 'linear'),
+                memory_limit=table_config.get('memory_limit'),
+                threads=table_config.get('threads'),
+                temp_directory=table_config.get('temp_directory'),
+                preserve_insertion_order=table_config.get('preserve_insertion_order')
             )
             tables.append(table_def)
 
@@ -554,6 +2840,9 @@ def create_meter_data_definitions() -> List[TableDefinition]:
     customers = TableDefinition(
         name="customers",
         primary_key="installation_id",
+        is_incremental=True,
+        incremental_field="last_modified",
+        load_mode="merge",
         fields=[
             FieldDefinition("installation_id", FieldType.STRING, required=True),
             FieldDefinition("customer_name", FieldType.STRING),
@@ -565,6 +2854,12 @@ def create_meter_data_definitions() -> List[TableDefinition]:
             FieldDefinition("registration_date", FieldType.TIMESTAMP),
             FieldDefinition("last_modified", FieldType.TIMESTAMP),
             FieldDefinition("status", FieldType.STRING),
+        ],
+        hash_columns=[
+            HashColumnDefinition("customer_hashdiff", [
+                "customer_name", "customer_type", "address", "city",
+                "postal_code", "country", "status"
+            ]),
         ]
     )
 
@@ -572,6 +2867,9 @@ def create_meter_data_definitions() -> List[TableDefinition]:
     accounts = TableDefinition(
         name="customer_accounts",
         primary_key="account_id",
+        is_incremental=True,
+        incremental_field="last_modified",
+        load_mode="merge",
         fields=[
             FieldDefinition("account_id", FieldType.STRING, required=True),
             FieldDefinition("installation_id", FieldType.STRING),
@@ -582,6 +2880,12 @@ def create_meter_data_definitions() -> List[TableDefinition]:
             FieldDefinition("account_closed_date", FieldType.TIMESTAMP),
             FieldDefinition("last_modified", FieldType.TIMESTAMP),
             FieldDefinition("status", FieldType.STRING),
+        ],
+        hash_columns=[
+            HashColumnDefinition("link_customer_account_hk", ["installation_id", "account_id"]),
+            HashColumnDefinition("customer_account_hashdiff", [
+                "account_number", "account_type", "billing_cycle", "status"
+            ]),
         ]
     )
 
@@ -589,6 +2893,9 @@ def create_meter_data_definitions() -> List[TableDefinition]:
     assets = TableDefinition(
         name="assets",
         primary_key="asset_id",
+        is_incremental=True,
+        incremental_field="last_modified",
+        load_mode="merge",
         fields=[
             FieldDefinition("asset_id", FieldType.STRING, required=True),
             FieldDefinition("account_id", FieldType.STRING),
@@ -601,6 +2908,13 @@ def create_meter_data_definitions() -> List[TableDefinition]:
             FieldDefinition("next_calibration_date", FieldType.TIMESTAMP),
             FieldDefinition("last_modified", FieldType.TIMESTAMP),
             FieldDefinition("status", FieldType.STRING),
+        ],
+        hash_columns=[
+            HashColumnDefinition("link_account_asset_hk", ["account_id", "asset_id"]),
+            HashColumnDefinition("asset_details_hashdiff", [
+                "asset_serial_number", "asset_type", "manufacturer", "model",
+                "installation_date", "status"
+            ]),
         ]
     )
 
@@ -609,6 +2923,13 @@ def create_meter_data_definitions() -> List[TableDefinition]:
         name="readings",
         is_incremental=True,
         incremental_field="creation_time",
+        partition_field="day(interval_start)",
+        sort_by=["asset_id", "interval_start"],
+        parallel_ranges=4,
+        chunk_rows=5_000_000,
+        row_group_size=122880,
+        compression="zstd",
+        compression_level=3,
         fields=[
             FieldDefinition("id", FieldType.INTEGER),
             FieldDefinition("asset_id", FieldType.STRING),
@@ -632,12 +2953,12 @@ def main():
     # Configuration
     config = DatabaseConfig()
 
-    # Data source
-    data_source = PostgreSQLDataSource(config)
-
     # Table definitions
     table_defs = create_meter_data_definitions()
 
+    # Data source
+    data_source = create_data_source(config, table_defs)
+
     # Loader
     loader = GenericDataLoader(
         config=config,
@@ -649,5 +2970,84 @@ def main():
     loader.load_all_tables()
 
 
+def service_main(argv: Optional[List[str]] = None):
+    """Service entry point: python load_data_generic.py serve [options]"""
+    config = DatabaseConfig()
+    parser = argparse.ArgumentParser(description="Run the loader as a long-lived service")
+    parser.add_argument("--config", help="Table configuration JSON (default: built-in definitions)")
+    parser.add_argument("--interval-seconds", type=int, default=config.service_interval_seconds)
+    parser.add_argument(
+        "--health-port", type=int, default=config.service_health_port,
+        help="Port of the HTTP health endpoint (0 = disabled)"
+    )
+    parser.add_argument("--max-cycles", type=int, help="Exit after this many cycles")
+    args = parser.parse_args(argv)
+
+    if args.config:
+        with open(args.config, 'r') as f:
+            table_defs = ConfigLoader.from_dict(json.load(f))
+    else:
+        table_defs = create_meter_data_definitions()
+
+    loader = GenericDataLoader(
+        config=config,
+        data_source=create_data_source(config, table_defs),
+        table_definitions=table_defs
+    )
+    LoaderService(loader, args.interval_seconds, args.health_port).serve_forever(args.max_cycles)
+
+
+def maintenance_main(argv: Optional[List[str]] = None):
+    """Maintenance entry point: python load_data_generic.py maintain [options]"""
+    parser = argparse.ArgumentParser(description="Iceberg table maintenance")
+    parser.add_argument("--table", action="append", help="Table to maintain (default: all)")
+    parser.add_argument("--config", help="Table configuration JSON (default: built-in definitions)")
+    parser.add_argument(
+        "--actions", default=",".join(IcebergTableMaintenance.ACTIONS),
+        help="Comma-separated subset of: " + ", ".join(IcebergTableMaintenance.ACTIONS)
+    )
+    parser.add_argument("--snapshot-retention-hours", type=float, default=168)
+    parser.add_argument("--orphan-older-than-hours", type=float, default=72)
+    parser.add_argument("--dry-run", action="store_true", help="Report planned actions only")
+    args = parser.parse_args(argv)
+
+    config = DatabaseConfig()
+    data_source = PostgreSQLDataSource(config)
+
+    if args.config:
+        with open(args.config, 'r') as f:
+            table_defs = ConfigLoader.from_dict(json.load(f))
+    else:
+        table_defs = create_meter_data_definitions()
+    if args.table:
+        table_defs = [t for t in table_defs if t.name in args.table]
+
+    actions = tuple(a.strip() for a in args.actions.split(",") if a.strip())
+    table_manager = IcebergTableManager(config, data_source)
+    connection = data_source.connect()
+    try:
+        table_manager.resources.apply(connection, table_manager.resources.global_settings())
+        maintenance = IcebergTableMaintenance(config, table_manager, connection)
+        reports = [
+            maintenance.maintain_table(
+                table_def,
+                actions=actions,
+                snapshot_retention=timedelta(hours=args.snapshot_retention_hours),
+                orphan_older_than=timedelta(hours=args.orphan_older_than_hours),
+                dry_run=args.dry_run
+            )
+            for table_def in table_defs
+        ]
+    finally:
+        data_source.disconnect()
+
+    print(json.dumps([report.__dict__ for report in reports], indent=2))
+
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "maintain":
+        maintenance_main(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == "serve":
+        service_main(sys.argv[2:])
+    else:
+        main()
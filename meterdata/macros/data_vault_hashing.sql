@@ -3,10 +3,17 @@
 {# ============================================================================ #}
 {# These macros generate MD5 hash keys and hash diffs for Data Vault 2.0     #}
 {# structures using Trino-compatible SQL                                      #}
+{#                                                                            #}
+{# When the loader already computed a column (hash_columns in the loader      #}
+{# table definition), pass its name as precomputed= and the macro selects it  #}
+{# instead of hashing again. Disable with the use_loader_hashes var.          #}
 {# ============================================================================ #}
 
 {# Generate hash key for hubs and links #}
-{% macro hash_key(columns, alias=none) -%}
+{% macro hash_key(columns, alias=none, precomputed=none) -%}
+    {%- if precomputed and var('use_loader_hashes', true) -%}
+        {{ precomputed }}
+    {%- else -%}
     {%- if columns is string -%}
         {%- set columns = [columns] -%}
     {%- endif -%}
@@ -20,11 +27,15 @@
         {%- endfor -%}
         TO_HEX(MD5(TO_UTF8(CONCAT({{ concat_string | join(", '||', ") }}))))
     {%- endif -%}
+    {%- endif -%}
     {%- if alias %} AS {{ alias }}{% endif -%}
 {%- endmacro %}
 
 {# Generate hash diff for satellites to detect changes #}
-{% macro hash_diff(columns, alias=none) -%}
+{% macro hash_diff(columns, alias=none, precomputed=none) -%}
+    {%- if precomputed and var('use_loader_hashes', true) -%}
+        {{ precomputed }}
+    {%- else -%}
     {%- if columns is string -%}
         {%- set columns = [columns] -%}
     {%- endif -%}
@@ -38,5 +49,6 @@
         {%- endfor -%}
         TO_HEX(MD5(TO_UTF8(CONCAT({{ concat_string | join(", '||', ") }}))))
     {%- endif -%}
+    {%- endif -%}
     {%- if alias %} AS {{ alias }}{% endif -%}
 {%- endmacro %}
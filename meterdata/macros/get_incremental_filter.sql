@@ -1,10 +1,65 @@
-{% macro get_incremental_filter(timestamp_column, lookback_hours=24) %}
+{% macro get_high_water_mark(column, relation=none) %}
+  {#-
+    Newest value of `column` in `relation` (default: this model) as a typed
+    SQL literal, or none when the relation is empty (or at parse time).
+
+    Read from the Iceberg "$partitions" metadata table, whose per-file
+    column upper bounds answer max() without scanning data files. Falls back
+    to select max() when the bounds are missing (e.g. metrics disabled for
+    the column) or inexact (strings);
+    --vars '{high_water_mark_source: scan}' always scans.
+  -#}
+  {%- if not execute -%}
+    {{ return(none) }}
+  {%- endif -%}
+  {%- set relation = relation or this -%}
+
+  {%- set row = none -%}
+  {%- if var('high_water_mark_source', 'metadata') == 'metadata' -%}
+    {%- set metadata_query -%}
+      select
+        cast(max(data.{{ column }}.max) as varchar),
+        typeof(max(data.{{ column }}.max))
+      from "{{ relation.database }}"."{{ relation.schema }}"."{{ relation.identifier }}$partitions"
+    {%- endset -%}
+    {%- set row = run_query(metadata_query).rows[0] -%}
+  {%- endif -%}
+
+  {#- Iceberg truncates string bounds, so only exact (non-varchar) bounds are used -#}
+  {%- if row is none or row[0] is none or row[1].startswith('varchar') -%}
+    {%- set scan_query -%}
+      select cast(max({{ column }}) as varchar), typeof(max({{ column }}))
+      from {{ relation }}
+    {%- endset -%}
+    {%- set row = run_query(scan_query).rows[0] -%}
+  {%- endif -%}
+
+  {%- if row[0] is none -%}
+    {{ return(none) }}
+  {%- endif -%}
+  {{ return("cast('" ~ row[0] ~ "' as " ~ row[1] ~ ")") }}
+{% endmacro %}
+
+{% macro get_incremental_filter(timestamp_column, lookback_hours=24, target_column=none, keyword='where') %}
   {% if is_incremental() %}
     -- Get records newer than the max timestamp in the target table
     -- Include a lookback period to handle late-arriving data
-    where {{ timestamp_column }} > (
-      select coalesce(max({{ timestamp_column }}), timestamp '1970-01-01 00:00:00') - interval '{{ lookback_hours }}' hour
-      from {{ this }}
+    -- The high-water mark is resolved from Iceberg metadata at compile time
+    {%- set high_water_mark = get_high_water_mark(target_column or timestamp_column) %}
+    {{ keyword }} {{ timestamp_column }} > (
+      coalesce({{ high_water_mark or 'null' }}, timestamp '1970-01-01 00:00:00') - interval '{{ lookback_hours }}' hour
     )
   {% endif %}
-{% endmacro %}
\ No newline at end of file
+{% endmacro %}
+
+{% macro staging_delta_filter() %}
+  {% if is_incremental() and not var('staging_full_scan', false) %}
+    -- Read every staging batch newer than the newest one in this model, so
+    -- batches staged while the model failed or did not run are not skipped
+    -- Run with --vars '{staging_full_scan: true}' to reprocess all staged rows
+    {%- set high_water_mark = get_high_water_mark('stg_loaded_at') %}
+    {%- if high_water_mark %}
+    and stg_loaded_at > {{ high_water_mark }}
+    {%- endif %}
+  {% endif %}
+{% endmacro %}
@@ -0,0 +1,89 @@
+{{
+  config(
+    materialized='incremental',
+    table_type='iceberg',
+    schema='business_vault',
+    unique_key=['asset_hk', 'reading_type', 'day_start'],
+    incremental_strategy='merge',
+    properties={
+      "format": "'PARQUET'",
+      "partitioning": ['day(day_start)']
+    }
+  )
+}}
+
+/*
+  Business Vault Table: Daily Asset Consumption
+  One row per asset, reading type and day of interval_start, rolled up
+  from agg_asset_consumption_hourly rather than the raw measurements.
+  Each run recomputes only the days with hourly buckets that changed
+  since the newest last_load_ts here, from all 24 hourly rows of the day.
+*/
+
+{# The hourly table is partitioned by day(hour_start), which last_load_ts   #}
+{# cannot prune. An hourly bucket changed since the high-water mark holds a #}
+{# satellite row loaded since then, so the lookup of changed hours starts   #}
+{# at the first day of those rows (found on the day(load_ts) partitions)    #}
+{% set first_changed_day = none %}
+{% if is_incremental() and execute %}
+    {% set bounds_query %}
+        select cast(date_trunc('day', min(interval_start)) as varchar)
+        from {{ ref('sat_asset_measurements') }}
+        {{ get_incremental_filter('load_ts', lookback_hours=var('rollup_lookback_hours', 0), target_column='last_load_ts') }}
+    {% endset %}
+    {% set first_changed_day = run_query(bounds_query).rows[0][0] %}
+{% endif %}
+
+with changed_hours as (
+    select
+        asset_hk,
+        reading_type,
+        date_trunc('day', hour_start) as day_start
+    from {{ ref('agg_asset_consumption_hourly') }}
+    {{ get_incremental_filter('last_load_ts', lookback_hours=var('rollup_lookback_hours', 0)) }}
+    {% if first_changed_day %}
+      and hour_start >= timestamp '{{ first_changed_day }}'
+    {% elif is_incremental() and execute %}
+      and 1 = 0  -- No new satellite rows: no hourly bucket changed
+    {% endif %}
+),
+
+affected_buckets as (
+    select distinct
+        asset_hk,
+        reading_type,
+        day_start
+    from changed_hours
+),
+
+hours as (
+    select
+        h.*,
+        date_trunc('day', h.hour_start) as day_start
+    from {{ ref('agg_asset_consumption_hourly') }} h
+    {% if is_incremental() %}
+    inner join affected_buckets b
+        on h.asset_hk = b.asset_hk
+       and h.reading_type = b.reading_type
+       and date_trunc('day', h.hour_start) = b.day_start
+    -- Bounds prune the day(hour_start) partitions of the hourly table
+    where h.hour_start >= (select min(day_start) from affected_buckets)
+      and h.hour_start < (select max(day_start) from affected_buckets) + interval '1' day
+    {% endif %}
+)
+
+select
+    asset_hk,
+    reading_type,
+    day_start,
+    max(unit_of_measure) as unit_of_measure,
+    sum(reading_count) as reading_count,
+    sum(non_good_reading_count) as non_good_reading_count,
+    sum(total_value) as total_value,
+    min(min_value) as min_value,
+    max(max_value) as max_value,
+    min(first_interval_start) as first_interval_start,
+    max(last_interval_end) as last_interval_end,
+    max(last_load_ts) as last_load_ts
+from hours
+group by asset_hk, reading_type, day_start
@@ -0,0 +1,85 @@
+{{
+  config(
+    materialized='incremental',
+    table_type='iceberg',
+    schema='business_vault',
+    unique_key=['asset_hk', 'reading_type', 'hour_start'],
+    incremental_strategy='merge',
+    properties={
+      "format": "'PARQUET'",
+      "partitioning": ['day(hour_start)']
+    }
+  )
+}}
+
+/*
+  Business Vault Table: Hourly Asset Consumption
+  One row per asset, reading type and hour of interval_start, so dashboards
+  read pre-aggregated rows instead of summing 15-minute measurements.
+  Each run finds the buckets touched by satellite rows loaded since the
+  newest last_load_ts here (minus rollup_lookback_hours), including late
+  readings for old hours, and recomputes only those buckets from all of
+  their measurements. A reading loaded more than once (a correction) is
+  counted once, with its latest value.
+*/
+
+with new_readings as (
+    select
+        asset_hk,
+        reading_type,
+        date_trunc('hour', interval_start) as hour_start
+    from {{ ref('sat_asset_measurements') }}
+    {{ get_incremental_filter('load_ts', lookback_hours=var('rollup_lookback_hours', 0), target_column='last_load_ts') }}
+),
+
+affected_buckets as (
+    select distinct
+        asset_hk,
+        reading_type,
+        hour_start
+    from new_readings
+),
+
+readings as (
+    select
+        m.asset_hk,
+        m.reading_type,
+        date_trunc('hour', m.interval_start) as hour_start,
+        m.interval_start,
+        m.interval_end,
+        m.reading_value,
+        m.unit_of_measure,
+        m.quality_code,
+        m.load_ts,
+        ROW_NUMBER() OVER (
+            PARTITION BY m.asset_hk, m.reading_type, m.interval_start, m.interval_end
+            ORDER BY m.load_ts DESC
+        ) as rn
+    from {{ ref('sat_asset_measurements') }} m
+    {% if is_incremental() %}
+    inner join affected_buckets b
+        on m.asset_hk = b.asset_hk
+       and m.reading_type = b.reading_type
+       and date_trunc('hour', m.interval_start) = b.hour_start
+    -- Bounds let Trino skip files by their interval_start statistics
+    where m.interval_start >= (select min(hour_start) from affected_buckets)
+      and m.interval_start < (select max(hour_start) from affected_buckets) + interval '1' hour
+    {% endif %}
+)
+
+select
+    asset_hk,
+    reading_type,
+    hour_start,
+    max(unit_of_measure) as unit_of_measure,
+    count(*) as reading_count,
+    count_if(quality_code <> 'GOOD') as non_good_reading_count,
+    sum(reading_value) as total_value,
+    min(reading_value) as min_value,
+    max(reading_value) as max_value,
+    min(interval_start) as first_interval_start,
+    max(interval_end) as last_interval_end,
+    max(load_ts) as last_load_ts
+from readings
+where rn = 1
+group by asset_hk, reading_type, hour_start
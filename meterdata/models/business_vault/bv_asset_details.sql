@@ -18,28 +18,15 @@ with assets as (
     from {{ ref('hub_asset') }}
 ),
 
-asset_details_ranked as (
-    select
-        asset_hk,
-        asset_id,
-        asset_type,
-        asset_installation_date as installation_date,
-        asset_status,
-        load_ts as detail_load_ts,
-        ROW_NUMBER() OVER (PARTITION BY asset_hk ORDER BY load_ts DESC) as rn
-    from {{ ref('sat_asset_details') }}
-),
-
 asset_details as (
     select
         asset_hk,
         asset_id,
         asset_type,
-        installation_date,
+        asset_installation_date as installation_date,
         asset_status,
-        detail_load_ts
-    from asset_details_ranked
-    where rn = 1
+        load_ts as detail_load_ts
+    from {{ ref('cur_asset_details') }}
 )
 
 select
@@ -9,6 +9,9 @@
   Business Vault View: Asset Measurements
   Complete view of all measurements with asset context
   Useful for analytics and reporting
+  Meter type and status are the ones valid at the measurement's
+  interval_start (as-of join through pit_asset_details); readings older
+  than an asset's first detail record get its current details.
 */
 
 with assets as (
@@ -33,14 +36,17 @@ measurements as (
     from {{ ref('sat_asset_measurements') }}
 ),
 
-asset_details_ranked as (
+asset_details_history as (
     select
-        asset_hk,
-        asset_type,
-        asset_status,
-        load_ts,
-        ROW_NUMBER() OVER (PARTITION BY asset_hk ORDER BY load_ts DESC) as rn
-    from {{ ref('sat_asset_details') }}
+        p.asset_hk,
+        p.effective_from,
+        p.effective_to,
+        s.asset_type,
+        s.asset_status
+    from {{ ref('pit_asset_details') }} p
+    inner join {{ ref('sat_asset_details') }} s
+        on p.asset_hk = s.asset_hk
+       and p.effective_from = s.load_ts
 ),
 
 asset_details as (
@@ -48,14 +54,13 @@ asset_details as (
         asset_hk,
         asset_type,
         asset_status
-    from asset_details_ranked
-    where rn = 1
+    from {{ ref('cur_asset_details') }}
 )
 
 select
     a.asset_id as meter_id,
-    ad.asset_type as meter_type,
-    ad.asset_status as meter_status,
+    coalesce(ah.asset_type, ad.asset_type) as meter_type,
+    coalesce(ah.asset_status, ad.asset_status) as meter_status,
     m.reading_id,
     m.reading_value,
     m.interval_start,
@@ -68,4 +73,8 @@ select
     a.asset_hk
 from measurements m
 inner join assets a on m.asset_hk = a.asset_hk
+left join asset_details_history ah
+    on m.asset_hk = ah.asset_hk
+   and m.interval_start >= ah.effective_from
+   and m.interval_start < ah.effective_to
 left join asset_details ad on a.asset_hk = ad.asset_hk
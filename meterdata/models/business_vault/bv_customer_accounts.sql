@@ -19,22 +19,12 @@ with customers as (
     from {{ ref('hub_customer') }}
 ),
 
-customer_details_ranked as (
-    select
-        customer_hk,
-        customer_id as customer_detail_id,
-        load_ts as customer_detail_load_ts,
-        ROW_NUMBER() OVER (PARTITION BY customer_hk ORDER BY load_ts DESC) as rn
-    from {{ ref('sat_customer_details') }}
-),
-
 customer_details as (
     select
         customer_hk,
-        customer_detail_id,
-        customer_detail_load_ts
-    from customer_details_ranked
-    where rn = 1
+        customer_id as customer_detail_id,
+        load_ts as customer_detail_load_ts
+    from {{ ref('cur_customer_details') }}
 ),
 
 accounts as (
@@ -45,22 +35,12 @@ accounts as (
     from {{ ref('hub_customer_account') }}
 ),
 
-account_details_ranked as (
-    select
-        customer_account_hk,
-        customer_account_id as account_detail_id,
-        load_ts as account_detail_load_ts,
-        ROW_NUMBER() OVER (PARTITION BY customer_account_hk ORDER BY load_ts DESC) as rn
-    from {{ ref('sat_customer_acc_details') }}
-),
-
 account_details as (
     select
         customer_account_hk,
-        account_detail_id,
-        account_detail_load_ts
-    from account_details_ranked
-    where rn = 1
+        customer_account_id as account_detail_id,
+        load_ts as account_detail_load_ts
+    from {{ ref('cur_customer_acc_details') }}
 ),
 
 link_customer_account as (
@@ -46,25 +46,13 @@ link_account_asset as (
     from {{ ref('link_account_asset') }}
 ),
 
-asset_details_ranked as (
-    select
-        asset_hk,
-        asset_type,
-        asset_installation_date as installation_date,
-        asset_status,
-        load_ts,
-        ROW_NUMBER() OVER (PARTITION BY asset_hk ORDER BY load_ts DESC) as rn
-    from {{ ref('sat_asset_details') }}
-),
-
 asset_details as (
     select
         asset_hk,
         asset_type,
-        installation_date,
+        asset_installation_date as installation_date,
         asset_status
-    from asset_details_ranked
-    where rn = 1
+    from {{ ref('cur_asset_details') }}
 )
 
 select
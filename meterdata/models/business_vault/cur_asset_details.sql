@@ -0,0 +1,84 @@
+{{
+  config(
+    materialized='incremental',
+    table_type='iceberg',
+    schema='business_vault',
+    unique_key='asset_hk',
+    incremental_strategy='merge'
+  )
+}}
+
+/*
+  Business Vault Table: Current Asset Details
+  Latest sat_asset_details record per asset, maintained incrementally.
+  Each run reads only satellite rows loaded since the newest load_ts here
+  (minus current_state_lookback_hours) and recomputes just the assets
+  they belong to, together with their current row, so views stop ranking
+  the whole satellite at query time.
+*/
+
+with new_records as (
+    select
+        asset_hk,
+        asset_details_hashdiff,
+        asset_id,
+        asset_serial_number,
+        asset_type,
+        manufacturer,
+        model,
+        asset_installation_date,
+        last_calibration_date,
+        next_calibration_date,
+        asset_status,
+        load_ts,
+        record_source
+    from {{ ref('sat_asset_details') }}
+    {{ get_incremental_filter('load_ts', lookback_hours=var('current_state_lookback_hours', 24)) }}
+),
+
+candidates as (
+    select * from new_records
+    {% if is_incremental() %}
+    union all
+    select
+        asset_hk,
+        asset_details_hashdiff,
+        asset_id,
+        asset_serial_number,
+        asset_type,
+        manufacturer,
+        model,
+        asset_installation_date,
+        last_calibration_date,
+        next_calibration_date,
+        asset_status,
+        load_ts,
+        record_source
+    from {{ this }}
+    where asset_hk in (select asset_hk from new_records)
+    {% endif %}
+),
+
+ranked as (
+    select
+        candidates.*,
+        ROW_NUMBER() OVER (PARTITION BY asset_hk ORDER BY load_ts DESC) as rn
+    from candidates
+)
+
+select
+    asset_hk,
+    asset_details_hashdiff,
+    asset_id,
+    asset_serial_number,
+    asset_type,
+    manufacturer,
+    model,
+    asset_installation_date,
+    last_calibration_date,
+    next_calibration_date,
+    asset_status,
+    load_ts,
+    record_source
+from ranked
+where rn = 1
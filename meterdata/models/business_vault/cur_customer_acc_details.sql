@@ -0,0 +1,78 @@
+{{
+  config(
+    materialized='incremental',
+    table_type='iceberg',
+    schema='business_vault',
+    unique_key='customer_account_hk',
+    incremental_strategy='merge'
+  )
+}}
+
+/*
+  Business Vault Table: Current Customer Account Details
+  Latest sat_customer_acc_details record per customer account, maintained incrementally.
+  Each run reads only satellite rows loaded since the newest load_ts here
+  (minus current_state_lookback_hours) and recomputes just the customer accounts
+  they belong to, together with their current row, so views stop ranking
+  the whole satellite at query time.
+*/
+
+with new_records as (
+    select
+        customer_account_hk,
+        customer_account_hashdiff,
+        customer_account_id,
+        account_number,
+        account_type,
+        billing_cycle,
+        account_opened_date,
+        account_closed_date,
+        account_status,
+        load_ts,
+        record_source
+    from {{ ref('sat_customer_acc_details') }}
+    {{ get_incremental_filter('load_ts', lookback_hours=var('current_state_lookback_hours', 24)) }}
+),
+
+candidates as (
+    select * from new_records
+    {% if is_incremental() %}
+    union all
+    select
+        customer_account_hk,
+        customer_account_hashdiff,
+        customer_account_id,
+        account_number,
+        account_type,
+        billing_cycle,
+        account_opened_date,
+        account_closed_date,
+        account_status,
+        load_ts,
+        record_source
+    from {{ this }}
+    where customer_account_hk in (select customer_account_hk from new_records)
+    {% endif %}
+),
+
+ranked as (
+    select
+        candidates.*,
+        ROW_NUMBER() OVER (PARTITION BY customer_account_hk ORDER BY load_ts DESC) as rn
+    from candidates
+)
+
+select
+    customer_account_hk,
+    customer_account_hashdiff,
+    customer_account_id,
+    account_number,
+    account_type,
+    billing_cycle,
+    account_opened_date,
+    account_closed_date,
+    account_status,
+    load_ts,
+    record_source
+from ranked
+where rn = 1
@@ -0,0 +1,84 @@
+{{
+  config(
+    materialized='incremental',
+    table_type='iceberg',
+    schema='business_vault',
+    unique_key='customer_hk',
+    incremental_strategy='merge'
+  )
+}}
+
+/*
+  Business Vault Table: Current Customer Details
+  Latest sat_customer_details record per customer, maintained incrementally.
+  Each run reads only satellite rows loaded since the newest load_ts here
+  (minus current_state_lookback_hours) and recomputes just the customers
+  they belong to, together with their current row, so views stop ranking
+  the whole satellite at query time.
+*/
+
+with new_records as (
+    select
+        customer_hk,
+        customer_hashdiff,
+        customer_id,
+        customer_name,
+        customer_type,
+        address,
+        city,
+        postal_code,
+        country,
+        registration_date,
+        customer_status,
+        load_ts,
+        record_source
+    from {{ ref('sat_customer_details') }}
+    {{ get_incremental_filter('load_ts', lookback_hours=var('current_state_lookback_hours', 24)) }}
+),
+
+candidates as (
+    select * from new_records
+    {% if is_incremental() %}
+    union all
+    select
+        customer_hk,
+        customer_hashdiff,
+        customer_id,
+        customer_name,
+        customer_type,
+        address,
+        city,
+        postal_code,
+        country,
+        registration_date,
+        customer_status,
+        load_ts,
+        record_source
+    from {{ this }}
+    where customer_hk in (select customer_hk from new_records)
+    {% endif %}
+),
+
+ranked as (
+    select
+        candidates.*,
+        ROW_NUMBER() OVER (PARTITION BY customer_hk ORDER BY load_ts DESC) as rn
+    from candidates
+)
+
+select
+    customer_hk,
+    customer_hashdiff,
+    customer_id,
+    customer_name,
+    customer_type,
+    address,
+    city,
+    postal_code,
+    country,
+    registration_date,
+    customer_status,
+    load_ts,
+    record_source
+from ranked
+where rn = 1
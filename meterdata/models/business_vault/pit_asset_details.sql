@@ -0,0 +1,61 @@
+{{
+  config(
+    materialized='incremental',
+    table_type='iceberg',
+    schema='business_vault',
+    unique_key=['asset_hk', 'effective_from'],
+    incremental_strategy='merge'
+  )
+}}
+
+/*
+  Business Vault Table: Asset Details PIT
+  One row per sat_asset_details record with its validity window
+  [effective_from, effective_to), for as-of joins such as the asset
+  attributes valid at a measurement's interval_start in
+  bv_asset_measurements (join back to the satellite on asset_hk and
+  load_ts = effective_from).
+  Incremental runs only recompute assets with new satellite rows: the new
+  rows plus the asset's currently open row, whose effective_to is closed
+  by the next change. Rows arriving later than current_state_lookback_hours
+  behind the newest change do not re-close older windows.
+*/
+
+with new_records as (
+    select
+        asset_hk,
+        load_ts
+    from {{ ref('sat_asset_details') }}
+    {{ get_incremental_filter('load_ts', lookback_hours=var('current_state_lookback_hours', 24), target_column='effective_from') }}
+),
+
+candidates as (
+    select
+        asset_hk,
+        load_ts as effective_from
+    from new_records
+    {% if is_incremental() %}
+    union
+    select
+        asset_hk,
+        effective_from
+    from {{ this }}
+    where is_current
+      and asset_hk in (select asset_hk from new_records)
+    {% endif %}
+),
+
+windowed as (
+    select
+        asset_hk,
+        effective_from,
+        LEAD(effective_from) OVER (PARTITION BY asset_hk ORDER BY effective_from) as next_effective_from
+    from candidates
+)
+
+select
+    asset_hk,
+    effective_from,
+    coalesce(next_effective_from, timestamp '9999-12-31 23:59:59.999999') as effective_to,
+    next_effective_from is null as is_current
+from windowed
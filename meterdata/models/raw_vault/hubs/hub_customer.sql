@@ -17,8 +17,9 @@ WITH source AS (
         load_ts,
         record_source,
         ROW_NUMBER() OVER (PARTITION BY customer_hk ORDER BY load_ts) as rn
-    FROM {{ ref('stg_meter_data') }}
+    FROM {{ ref('stg_customers') }}
     WHERE customer_hk IS NOT NULL
+    {{ get_incremental_filter('load_ts', lookback_hours=var('raw_vault_lookback_hours', 24), keyword='and') }}
 )
 , deduplicated AS (
     SELECT
@@ -18,10 +18,11 @@ WITH source AS (
         load_ts,
         record_source,
         ROW_NUMBER() OVER (PARTITION BY link_customer_account_hk ORDER BY load_ts) as rn
-    FROM {{ ref('stg_meter_data') }}
+    FROM {{ ref('stg_customer_accounts') }}
     WHERE link_customer_account_hk IS NOT NULL
       AND customer_hk IS NOT NULL
       AND customer_account_hk IS NOT NULL
+    {{ get_incremental_filter('load_ts', lookback_hours=var('raw_vault_lookback_hours', 24), keyword='and') }}
 )
 , deduplicated AS (
     SELECT
@@ -4,7 +4,8 @@
     table_type='iceberg',
     schema='raw_vault',
     unique_key=['asset_hk', 'interval_start', 'interval_end', 'reading_type', 'load_ts'],
-    incremental_strategy='merge',
+    incremental_strategy='append',
+    on_schema_change='append_new_columns',
     properties={
       "format": "'PARQUET'",
       "partitioning": ['day(load_ts)']
@@ -14,6 +15,24 @@
 
 {# Satellite: Asset Measurements - Time-series measurement data for assets #}
 {# Uniqueness: asset_hk + interval_start + interval_end + reading_type + load_ts #}
+{# Incremental runs anti-join the batch against only the load_ts range it     #}
+{# covers (pruning day(load_ts) partitions) and append the new rows, so cost  #}
+{# tracks batch size. load_ts is part of the key, so a duplicate can only sit #}
+{# inside that range; sat_measurements_lookback_hours widens it for late data #}
+{# The batch is every staging batch newer than the stg_loaded_at stored here #}
+
+{% set load_ts_bounds = none %}
+{% if is_incremental() and execute %}
+    {% set bounds_query %}
+        SELECT
+            CAST(min(load_ts) - INTERVAL '{{ var("sat_measurements_lookback_hours", 0) }}' HOUR AS VARCHAR),
+            CAST(max(load_ts) AS VARCHAR)
+        FROM {{ ref('stg_readings') }}
+        WHERE asset_hk IS NOT NULL
+        {{ staging_delta_filter() }}
+    {% endset %}
+    {% set load_ts_bounds = run_query(bounds_query).rows[0] %}
+{% endif %}
 
 WITH source AS (
     SELECT
@@ -27,9 +46,11 @@ WITH source AS (
         quality_code,
         reading_status,
         load_ts,
-        record_source
-    FROM {{ ref('stg_meter_data') }}
+        record_source,
+        stg_loaded_at
+    FROM {{ ref('stg_readings') }}
     WHERE asset_hk IS NOT NULL
+    {{ staging_delta_filter() }}
 )
 
 {% if is_incremental() %}
@@ -41,6 +62,11 @@ WITH source AS (
         reading_type,
         load_ts
     FROM {{ this }}
+    {% if load_ts_bounds and load_ts_bounds[0] is not none %}
+    WHERE load_ts BETWEEN TIMESTAMP '{{ load_ts_bounds[0] }}' AND TIMESTAMP '{{ load_ts_bounds[1] }}'
+    {% elif execute %}
+    WHERE 1 = 0  -- Empty batch: nothing to compare against
+    {% endif %}
 )
 , records_to_insert AS (
     SELECT s.*
@@ -25,8 +25,9 @@ WITH source AS (
         customer_status,
         load_ts,
         record_source
-    FROM {{ ref('stg_meter_data') }}
+    FROM {{ ref('stg_customers') }}
     WHERE customer_hk IS NOT NULL
+    {{ get_incremental_filter('load_ts', lookback_hours=var('raw_vault_lookback_hours', 24), keyword='and') }}
 )
 
 {% if is_incremental() %}
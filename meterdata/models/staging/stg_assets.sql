@@ -0,0 +1,50 @@
+{{
+  config(
+    materialized='view'
+  )
+}}
+
+{#-
+  Staging layer for Data Vault 2.0: assets
+
+  One row per asset (meter), feeding Hub Asset, Link Account-Asset and
+  Sat Asset Details.
+  load_ts is the source last_modified timestamp.
+-#}
+
+with assets as (
+    select * from {{ source('raw', 'assets') }}
+)
+
+select
+    -- Business Keys
+    account_id as customer_account_id,
+    asset_id,
+
+    -- Natural Keys for Hubs
+    account_id as customer_account_hk,
+    asset_id as asset_hk,
+
+    -- Hash Key for Link
+    {{ hash_key(['account_id', 'asset_id'], precomputed='link_account_asset_hk') }} as link_account_asset_hk,
+
+    -- Hash Diff for Satellite
+    {{ hash_diff(['asset_serial_number', 'asset_type', 'manufacturer', 'model', 'installation_date', 'status'], precomputed='asset_details_hashdiff') }} as asset_details_hashdiff,
+
+    -- Asset Details (Satellite Payload)
+    asset_serial_number,
+    asset_type,
+    manufacturer,
+    model,
+    installation_date as asset_installation_date,
+    last_calibration_date,
+    next_calibration_date,
+    status as asset_status,
+
+    -- Metadata
+    last_modified as load_ts,
+    'METER_DATA_SYSTEM' as record_source
+
+from assets
+where asset_id is not null
+  and account_id is not null
@@ -0,0 +1,48 @@
+{{
+  config(
+    materialized='view'
+  )
+}}
+
+{#-
+  Staging layer for Data Vault 2.0: customer accounts
+
+  One row per account, feeding Hub Customer Account, Link Customer-Account
+  and Sat Customer Account Details.
+  load_ts is the source last_modified timestamp.
+-#}
+
+with customer_accounts as (
+    select * from {{ source('raw', 'customer_accounts') }}
+)
+
+select
+    -- Business Keys
+    installation_id as customer_id,
+    account_id as customer_account_id,
+
+    -- Natural Keys for Hubs
+    installation_id as customer_hk,
+    account_id as customer_account_hk,
+
+    -- Hash Key for Link
+    {{ hash_key(['installation_id', 'account_id'], precomputed='link_customer_account_hk') }} as link_customer_account_hk,
+
+    -- Hash Diff for Satellite
+    {{ hash_diff(['account_number', 'account_type', 'billing_cycle', 'status'], precomputed='customer_account_hashdiff') }} as customer_account_hashdiff,
+
+    -- Account Details (Satellite Payload)
+    account_number,
+    account_type,
+    billing_cycle,
+    account_opened_date,
+    account_closed_date,
+    status as account_status,
+
+    -- Metadata
+    last_modified as load_ts,
+    'METER_DATA_SYSTEM' as record_source
+
+from customer_accounts
+where account_id is not null
+  and installation_id is not null
@@ -0,0 +1,44 @@
+{{
+  config(
+    materialized='view'
+  )
+}}
+
+{#-
+  Staging layer for Data Vault 2.0: customers
+
+  One row per customer (installation), so Hub Customer and Sat Customer
+  Details are built from the dimension instead of every reading.
+  load_ts is the source last_modified timestamp.
+-#}
+
+with customers as (
+    select * from {{ source('raw', 'customers') }}
+)
+
+select
+    -- Business Key
+    installation_id as customer_id,
+
+    -- Natural Key for Hub
+    installation_id as customer_hk,
+
+    -- Hash Diff for Satellite
+    {{ hash_diff(['customer_name', 'customer_type', 'address', 'city', 'postal_code', 'country', 'status'], precomputed='customer_hashdiff') }} as customer_hashdiff,
+
+    -- Customer Details (Satellite Payload)
+    customer_name,
+    customer_type,
+    address,
+    city,
+    postal_code,
+    country,
+    registration_date,
+    status as customer_status,
+
+    -- Metadata
+    last_modified as load_ts,
+    'METER_DATA_SYSTEM' as record_source
+
+from customers
+where installation_id is not null
@@ -0,0 +1,60 @@
+{{
+  config(
+    materialized='incremental',
+    table_type='iceberg',
+    incremental_strategy='append',
+    properties={
+      "format": "'PARQUET'",
+      "partitioning": ['day(load_ts)']
+    }
+  )
+}}
+
+{#-
+  Staging layer for Data Vault 2.0: readings
+
+  One row per reading, feeding Sat Asset Measurements. Dimension hubs,
+  links and satellites are staged from stg_customers, stg_customer_accounts
+  and stg_assets, so this model only carries the asset key and the
+  measurement payload. Readings are not filtered on stg_assets: a reading
+  can be staged before its asset, and dropping it here would let the
+  load_ts high-water mark move past it for good. The asset relationship is
+  checked on sat_asset_measurements instead.
+
+  Incremental loading:
+  - Materialized as an Iceberg table partitioned by day(load_ts); each run
+    stages only readings created after the newest load_ts already staged
+    (the loader's creation_time watermark, so no lookback is applied)
+  - Every batch is stamped with stg_loaded_at (the dbt run start), and the
+    raw vault reads all batches newer than the newest stg_loaded_at it has
+    stored through staging_delta_filter
+-#}
+
+with readings as (
+    select * from {{ source('raw', 'readings') }}
+    {{ get_incremental_filter('creation_time', lookback_hours=0, target_column='load_ts') }}
+)
+
+select
+    -- Business Key
+    asset_id,
+
+    -- Natural Key for Hub
+    asset_id as asset_hk,
+
+    -- Measurement Details (Satellite Payload)
+    id as reading_id,
+    reading_value,
+    interval_start,
+    interval_end,
+    reading_type,
+    unit_of_measure,
+    quality_code,
+    status as reading_status,
+
+    -- Metadata
+    creation_time as load_ts,
+    coalesce(source_system, 'METER_DATA_SYSTEM') as record_source,
+    timestamp '{{ run_started_at.strftime("%Y-%m-%d %H:%M:%S.%f") }}' as stg_loaded_at
+
+from readings
@@ -0,0 +1,99 @@
+"""source_engine 'binary_copy': driver check and the Arrow stream path of the loader
+
+No PostgreSQL server is needed: ArrowDuckDBSource serves the COPY query of
+PostgreSQLCopySource from the DuckDB stand-in (its casts are valid DuckDB
+SQL), so the stream is registered and loaded exactly as the ADBC one is.
+"""
+
+import copy
+import os
+import sys
+
+import duckdb
+import pyarrow as pa
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import DuckDBDataSource, generate_dimensions, generate_readings  # noqa: E402
+from load_data_generic import (  # noqa: E402
+    ArrowSourceInterface,
+    DatabaseConfig,
+    GenericDataLoader,
+    IcebergTableManager,
+    PostgreSQLCopySource,
+    PostgreSQLDataSource,
+    create_data_source,
+    create_meter_data_definitions,
+)
+
+
+class ArrowDuckDBSource(DuckDBDataSource, ArrowSourceInterface):
+    """DuckDB stand-in answering read_arrow with PostgreSQLCopySource's query"""
+
+    def read_arrow(self, table_def, source_schema, predicate=None):
+        schema = pa.schema([(f.name, PostgreSQLCopySource.arrow_type(f)) for f in table_def.fields])
+        query = PostgreSQLCopySource.copy_query(table_def, source_schema, predicate)
+        connection = self.create_isolated_connection()
+        try:
+            rows = connection.execute(query).arrow()
+            batches = (rows.read_all() if hasattr(rows, "read_all") else rows).to_batches()
+        finally:
+            connection.close()
+        return pa.RecordBatchReader.from_batches(schema, [
+            pa.RecordBatch.from_arrays(
+                [column.cast(t) for column, t in zip(batch.columns, schema.types)], schema=schema
+            )
+            for batch in batches
+        ])
+
+
+def readings_definition(source_engine):
+    readings = next(t for t in create_meter_data_definitions() if t.name == "readings")
+    readings = copy.deepcopy(readings)
+    readings.source_engine = source_engine
+    return readings
+
+
+def test_missing_driver_is_reported_up_front(monkeypatch):
+    monkeypatch.setitem(sys.modules, "adbc_driver_postgresql", None)
+    monkeypatch.setitem(sys.modules, "adbc_driver_postgresql.dbapi", None)
+    config = DatabaseConfig()
+    assert isinstance(create_data_source(config, [readings_definition("scanner")]), PostgreSQLDataSource)
+    with pytest.raises(ImportError, match="adbc-driver-postgresql"):
+        create_data_source(config, [readings_definition("binary_copy")])
+
+
+def test_copy_query_casts_to_wire_types():
+    query = PostgreSQLCopySource.copy_query(
+        readings_definition("binary_copy"), "meter_data", "creation_time > TIMESTAMP '2024-01-01'"
+    )
+    assert "reading_value::numeric(15, 3)::text AS reading_value" in query
+    assert "id::int4 AS id" in query
+    assert query.endswith("FROM meter_data.readings WHERE creation_time > TIMESTAMP '2024-01-01'")
+
+
+def test_binary_copy_loads_the_same_rows_as_the_scanner(tmp_path):
+    database_path = str(tmp_path / "source.duckdb")
+    connection = duckdb.connect(database_path)
+    try:
+        generate_dimensions(connection, 5, 1, 2, seed=1)
+        generate_readings(connection, 2000, seed=1)
+    finally:
+        connection.close()
+
+    tables = {}
+    for engine, source_class in (("scanner", DuckDBDataSource), ("binary_copy", ArrowDuckDBSource)):
+        config = DatabaseConfig(
+            storage_root=str(tmp_path / engine / "lake"),
+            catalog_uri=f"sqlite:///{tmp_path / f'{engine}.db'}",
+        )
+        source = source_class(config, database_path)
+        result = GenericDataLoader(config, source, [readings_definition(engine)]).load_all_tables()[0]
+        assert result.success, result.error
+        table = IcebergTableManager(config, source)._get_catalog() \
+            .load_table((config.iceberg_namespace, "readings"))
+        tables[engine] = table.scan().to_arrow().sort_by("id").to_pylist()
+
+    assert len(tables["scanner"]) == 2000
+    assert tables["binary_copy"] == tables["scanner"]
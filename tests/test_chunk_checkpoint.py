@@ -0,0 +1,140 @@
+"""Resuming a chunked load after a failure part-way through a chunk
+
+Runs the loader against a local DuckDB source, a local storage root and a
+SQLite catalog (the benchmark stand-ins), so no services are needed.
+"""
+
+import os
+import sys
+from datetime import timedelta
+
+import duckdb
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import DuckDBDataSource, generate_dimensions, generate_readings  # noqa: E402
+from load_data_generic import (  # noqa: E402
+    DatabaseConfig,
+    GenericDataLoader,
+    IcebergTableMaintenance,
+    IcebergTableManager,
+    create_meter_data_definitions,
+)
+
+
+@pytest.fixture
+def environment(tmp_path):
+    database_path = str(tmp_path / "source.duckdb")
+    connection = duckdb.connect(database_path)
+    try:
+        generate_dimensions(connection, 5, 1, 2, seed=1)
+        generate_readings(connection, 4000, seed=1)
+    finally:
+        connection.close()
+
+    config = DatabaseConfig(
+        storage_root=str(tmp_path / "lake"),
+        catalog_uri=f"sqlite:///{tmp_path / 'catalog.db'}",
+    )
+    # Default readings definition: day(interval_start) partitions, 4 parallel ranges
+    readings = next(t for t in create_meter_data_definitions() if t.name == "readings")
+    readings.chunk_rows = 1000
+    return config, database_path, readings
+
+
+def run(config, database_path, table_def):
+    loader = GenericDataLoader(config, DuckDBDataSource(config, database_path), [table_def])
+    return loader.load_all_tables()[0]
+
+
+def loaded_ids(config, database_path):
+    table = IcebergTableManager(config, DuckDBDataSource(config, database_path)) \
+        ._get_catalog().load_table((config.iceberg_namespace, "readings"))
+    return table.scan(selected_fields=("id",)).to_arrow().column("id").to_pylist()
+
+
+def source_ids(database_path):
+    connection = duckdb.connect(database_path, read_only=True)
+    try:
+        return [row[0] for row in connection.execute("SELECT id FROM meter_data.readings").fetchall()]
+    finally:
+        connection.close()
+
+
+def fail_sixth_export(monkeypatch):
+    """Fail the sixth export once, after it wrote its files; returns the exports made"""
+    export_to_parquet = IcebergTableManager.export_to_parquet
+    calls = []
+    failed = []
+
+    def failing_export(*args, **kwargs):
+        files = export_to_parquet(*args, **kwargs)
+        calls.append(files)
+        if len(calls) == 6 and not failed:
+            failed.append(files)
+            raise RuntimeError("S3 timeout")
+        return files
+
+    monkeypatch.setattr(IcebergTableManager, "export_to_parquet", staticmethod(failing_export))
+    return calls
+
+
+def test_failed_partitioned_chunk_resumes(environment, monkeypatch):
+    config, database_path, readings = environment
+
+    # Fail the second range of the second chunk after it wrote its files
+    calls = fail_sixth_export(monkeypatch)
+    result = run(config, database_path, readings)
+    assert not result.success
+    partial = len(loaded_ids(config, database_path))
+    assert 0 < partial < 4000
+
+    # The retry resumes at the failed chunk and exports only the remaining chunks
+    calls.clear()
+    result = run(config, database_path, readings)
+    assert result.success, result.error
+    ids = loaded_ids(config, database_path)
+    assert sorted(ids) == sorted(source_ids(database_path))
+    assert len(calls) < 16
+    # Every chunk has its own export stage
+    exported = sum(m.bytes_written for m in result.stages if m.stage == "export")
+    assert exported == sum(os.path.getsize(f) for files in calls for f in files)
+
+    # New rows are loaded by the next run
+    connection = duckdb.connect(database_path)
+    try:
+        generate_readings(connection, 500, seed=1)
+    finally:
+        connection.close()
+    result = run(config, database_path, readings)
+    assert result.success, result.error
+    assert sorted(loaded_ids(config, database_path)) == sorted(source_ids(database_path))
+
+
+def test_pending_chunks_survive_snapshot_expiry(environment, monkeypatch):
+    config, database_path, readings = environment
+    config.state_backend = "iceberg"
+    assert run(config, database_path, readings).success
+
+    connection = duckdb.connect(database_path)
+    try:
+        generate_readings(connection, 3000, seed=2)
+    finally:
+        connection.close()
+
+    # The second chunk of the new rows fails; then every snapshot but the
+    # current one (the first chunk's commit) is expired, including the one
+    # that recorded the previous watermark
+    fail_sixth_export(monkeypatch)
+    result = run(config, database_path, readings)
+    assert not result.success
+    source = DuckDBDataSource(config, database_path)
+    report = IcebergTableMaintenance(config, IcebergTableManager(config, source), None) \
+        .maintain_table(readings, actions=("expire-snapshots",), snapshot_retention=timedelta(0))
+    assert report.error is None and report.expired_snapshots > 0
+
+    # The resumed load finishes the checkpoint window instead of reloading
+    result = run(config, database_path, readings)
+    assert result.success, result.error
+    assert sorted(loaded_ids(config, database_path)) == sorted(source_ids(database_path))
@@ -0,0 +1,74 @@
+"""Commits tagged with a load ID are never applied twice"""
+
+import os
+import sys
+
+import duckdb
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import DuckDBDataSource  # noqa: E402
+from load_data_generic import (  # noqa: E402
+    DatabaseConfig,
+    FieldDefinition,
+    FieldType,
+    IcebergTableManager,
+    LoadMetrics,
+    SchemaConverter,
+    TableDefinition,
+)
+
+
+@pytest.fixture
+def table_and_files(tmp_path):
+    config = DatabaseConfig(
+        storage_root=str(tmp_path / "lake"),
+        catalog_uri=f"sqlite:///{tmp_path / 'catalog.db'}",
+    )
+    manager = IcebergTableManager(config, DuckDBDataSource(config, ":memory:"))
+    manager.metrics = LoadMetrics()
+    events = TableDefinition(
+        name="events",
+        fields=[FieldDefinition("id", FieldType.LONG)],
+    )
+    table = manager.create_or_get_table(events, SchemaConverter.table_definition_to_schema(events))
+
+    path = str(tmp_path / "lake" / "events" / "load-1.parquet")
+    os.makedirs(os.path.dirname(path))
+    connection = duckdb.connect()
+    try:
+        files = manager.export_to_parquet(connection, "SELECT range::BIGINT AS id FROM range(10)", path)
+    finally:
+        connection.close()
+    return manager, table, files
+
+
+def row_count(table):
+    table.refresh()
+    return table.scan().to_arrow().num_rows
+
+
+def test_recommitting_a_load_is_a_no_op(table_and_files):
+    manager, table, files = table_and_files
+    assert manager.commit_files(table, files, "load-1")
+    assert manager.is_load_committed(table, "load-1")
+    assert not manager.is_load_committed(table, "load-2")
+
+    assert not manager.commit_files(table, files, "load-1")
+    assert row_count(table) == 10
+
+
+def test_commit_with_lost_response_is_not_retried(table_and_files, monkeypatch):
+    manager, table, files = table_and_files
+    add_files = table.add_files
+
+    def add_files_then_fail(*args, **kwargs):
+        # The commit lands, but the caller sees an error (e.g. a timeout)
+        add_files(*args, **kwargs)
+        raise TimeoutError("catalog response lost")
+
+    monkeypatch.setattr(table, "add_files", add_files_then_fail)
+    assert not manager.commit_files(table, files, "load-1")
+    assert row_count(table) == 10
+    assert len(table.metadata.snapshots) == 1
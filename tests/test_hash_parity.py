@@ -0,0 +1,130 @@
+"""Loader hash columns equal the hash_key/hash_diff dbt macros they replace
+
+The dbt macros run on Trino as TO_HEX(MD5(TO_UTF8(CONCAT(COALESCE(CAST(c AS
+VARCHAR), ''), '||', ...)))). trino_hash reproduces that in Python, with
+Trino's VARCHAR rendering of each type, so the DuckDB expressions can be
+checked without a Trino server.
+"""
+
+import datetime
+import decimal
+import glob
+import hashlib
+import os
+import re
+import sys
+
+import duckdb
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from load_data_generic import (  # noqa: E402
+    FieldDefinition,
+    FieldType,
+    HashColumnDefinition,
+    SchemaConverter,
+    TableDefinition,
+    create_meter_data_definitions,
+)
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def trino_varchar(value):
+    """CAST(value AS VARCHAR) in Trino, with NULL as '' (COALESCE in the macros)"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime.datetime):
+        # timestamp(6) keeps all six fractional digits
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+    return str(value)
+
+
+def trino_hash(values):
+    return hashlib.md5("||".join(trino_varchar(v) for v in values).encode("utf-8")).digest()
+
+
+SAMPLE = TableDefinition(
+    name="sample",
+    fields=[
+        FieldDefinition("name", FieldType.STRING),
+        FieldDefinition("amount", FieldType.DECIMAL, precision=12, scale=2),
+        FieldDefinition("count", FieldType.INTEGER),
+        FieldDefinition("big", FieldType.LONG),
+        FieldDefinition("flag", FieldType.BOOLEAN),
+        FieldDefinition("day", FieldType.DATE),
+        FieldDefinition("created", FieldType.TIMESTAMP),
+    ],
+)
+
+ROWS = [
+    ("Müller", decimal.Decimal("10.50"), 7, 2 ** 40, True,
+     datetime.date(2024, 1, 31), datetime.datetime(2024, 1, 31, 23, 59, 59, 123456)),
+    ("", decimal.Decimal("-0.01"), 0, -1, False,
+     datetime.date(1999, 12, 1), datetime.datetime(2024, 2, 1)),
+    (None, None, None, None, None, None, None),
+]
+
+
+@pytest.fixture
+def sample_connection():
+    connection = duckdb.connect()
+    connection.execute("""
+        CREATE TABLE sample (
+            name VARCHAR, amount DECIMAL(12, 2), count INTEGER, big BIGINT,
+            flag BOOLEAN, day DATE, created TIMESTAMP
+        )
+    """)
+    connection.executemany("INSERT INTO sample VALUES (?, ?, ?, ?, ?, ?, ?)", ROWS)
+    yield connection
+    connection.close()
+
+
+@pytest.mark.parametrize("columns", [
+    ["name"],
+    ["name", "amount", "count", "big", "flag", "day", "created"],
+    ["created", "name"],
+])
+def test_hash_expression_matches_trino_macro(sample_connection, columns):
+    expressions = [
+        SchemaConverter.hash_expression(SAMPLE, HashColumnDefinition(fmt, columns, fmt))
+        for fmt in ("hex", "binary", "bigint")
+    ]
+    names = [f.name for f in SAMPLE.fields]
+    rows = sample_connection.execute(
+        f"SELECT {', '.join(names + expressions)} FROM sample"
+    ).fetchall()
+    for row in rows:
+        values = dict(zip(names, row))
+        digest = trino_hash([values[c] for c in columns])
+        hex_hash, binary_hash, bigint_hash = row[len(names):]
+        assert hex_hash == digest.hex().upper()
+        assert bytes(binary_hash) == digest
+        assert bigint_hash == int.from_bytes(digest[:8], "big", signed=True)
+
+
+def test_floating_point_fields_are_rejected():
+    table_def = TableDefinition(name="t", fields=[FieldDefinition("value", FieldType.DOUBLE)])
+    with pytest.raises(ValueError):
+        SchemaConverter.hash_expression(table_def, HashColumnDefinition("h", ["value"]))
+
+
+def test_precomputed_hashes_match_loader_definitions():
+    """Every precomputed= column in the staging models hashes the same columns in the loader"""
+    loader_columns = {
+        h.name: h.columns
+        for table_def in create_meter_data_definitions()
+        for h in table_def.hash_columns
+    }
+    call = re.compile(r"hash_(?:key|diff)\((\[[^\]]*\]),\s*precomputed='(\w+)'\)")
+    found = 0
+    for path in glob.glob(os.path.join(REPO, "meterdata", "models", "staging", "*.sql")):
+        with open(path) as f:
+            for columns, name in call.findall(f.read()):
+                assert name in loader_columns, f"{os.path.basename(path)}: no loader column {name}"
+                assert re.findall(r"'(\w+)'", columns) == loader_columns[name], name
+                found += 1
+    assert found == len(loader_columns)
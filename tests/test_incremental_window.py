@@ -0,0 +1,69 @@
+"""First and follow-up incremental loads of a table with a numeric incremental field"""
+
+import os
+import sys
+
+import duckdb
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import DuckDBDataSource  # noqa: E402
+from load_data_generic import (  # noqa: E402
+    DatabaseConfig,
+    FieldDefinition,
+    FieldType,
+    GenericDataLoader,
+    IcebergTableManager,
+    TableDefinition,
+)
+
+
+def insert_events(database_path, first_id, count):
+    connection = duckdb.connect(database_path)
+    try:
+        connection.execute("CREATE SCHEMA IF NOT EXISTS meter_data")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS meter_data.events (id BIGINT, amount DOUBLE)"
+        )
+        connection.execute(
+            "INSERT INTO meter_data.events SELECT range, range * 0.5 FROM range(?, ?)",
+            [first_id, first_id + count],
+        )
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("state_backend", ["s3", "iceberg"])
+def test_numeric_incremental_field(tmp_path, state_backend):
+    database_path = str(tmp_path / "source.duckdb")
+    insert_events(database_path, 1, 100)
+    config = DatabaseConfig(
+        storage_root=str(tmp_path / "lake"),
+        catalog_uri=f"sqlite:///{tmp_path / 'catalog.db'}",
+        state_backend=state_backend,
+    )
+    events = TableDefinition(
+        name="events",
+        fields=[
+            FieldDefinition("id", FieldType.LONG, required=True),
+            FieldDefinition("amount", FieldType.DOUBLE),
+        ],
+        is_incremental=True,
+        incremental_field="id",
+        primary_key="id",
+    )
+
+    def load():
+        source = DuckDBDataSource(config, database_path)
+        result = GenericDataLoader(config, source, [events]).load_all_tables()[0]
+        assert result.success, result.error
+        table = IcebergTableManager(config, source)._get_catalog() \
+            .load_table((config.iceberg_namespace, "events"))
+        return sorted(table.scan(selected_fields=("id",)).to_arrow().column("id").to_pylist())
+
+    # No watermark yet: the first load has no lower bound on id
+    assert load() == list(range(1, 101))
+
+    insert_events(database_path, 101, 50)
+    assert load() == list(range(1, 151))
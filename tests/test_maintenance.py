@@ -0,0 +1,107 @@
+"""Maintenance actions on a local storage root"""
+
+import os
+import sys
+import time
+from datetime import timedelta
+
+import duckdb
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import DuckDBDataSource, generate_dimensions, generate_readings  # noqa: E402
+from load_data_generic import (  # noqa: E402
+    DatabaseConfig,
+    GenericDataLoader,
+    IcebergTableMaintenance,
+    IcebergTableManager,
+    create_meter_data_definitions,
+)
+
+
+@pytest.fixture
+def loaded(tmp_path):
+    """Readings loaded in three runs (three snapshots and manifests)"""
+    database_path = str(tmp_path / "source.duckdb")
+    config = DatabaseConfig(
+        storage_root=str(tmp_path / "lake"),
+        catalog_uri=f"sqlite:///{tmp_path / 'catalog.db'}",
+    )
+    readings = next(t for t in create_meter_data_definitions() if t.name == "readings")
+    connection = duckdb.connect(database_path)
+    try:
+        generate_dimensions(connection, 5, 1, 2, seed=1)
+    finally:
+        connection.close()
+    for seed in (1, 2, 3):
+        connection = duckdb.connect(database_path)
+        try:
+            generate_readings(connection, 300, seed=seed)
+        finally:
+            connection.close()
+        source = DuckDBDataSource(config, database_path)
+        result = GenericDataLoader(config, source, [readings]).load_all_tables()[0]
+        assert result.success, result.error
+
+    manager = IcebergTableManager(config, DuckDBDataSource(config, database_path))
+    connection = duckdb.connect()
+    yield config, readings, manager, IcebergTableMaintenance(config, manager, connection)
+    connection.close()
+
+
+def load_table(config, manager):
+    return manager._get_catalog().load_table((config.iceberg_namespace, "readings"))
+
+
+def row_count(config, manager):
+    return load_table(config, manager).scan().to_arrow().num_rows
+
+
+def test_orphans_are_found_and_removed(loaded):
+    config, readings, manager, maintenance = loaded
+    stray = os.path.join(config.storage_root, "readings", "failed-load.parquet")
+    with open(stray, "w") as f:
+        f.write("partial")
+    time.sleep(0.01)
+
+    report = maintenance.maintain_table(
+        readings, actions=("remove-orphans",), orphan_older_than=timedelta(0), dry_run=True
+    )
+    assert report.orphan_files == [stray]
+    assert os.path.exists(stray)
+
+    report = maintenance.maintain_table(
+        readings, actions=("remove-orphans",), orphan_older_than=timedelta(0)
+    )
+    assert report.orphan_files == [stray]
+    assert not os.path.exists(stray)
+    assert row_count(config, manager) == 900
+
+
+def test_expiry_count_matches_and_keeps_refs(loaded):
+    config, readings, manager, maintenance = loaded
+    table = load_table(config, manager)
+    tagged = table.metadata.snapshots[0].snapshot_id
+    table.manage_snapshots().create_tag(tagged, "first-load").commit()
+
+    dry_run = maintenance.maintain_table(
+        readings, actions=("expire-snapshots",), snapshot_retention=timedelta(0), dry_run=True
+    )
+    report = maintenance.maintain_table(
+        readings, actions=("expire-snapshots",), snapshot_retention=timedelta(0)
+    )
+    assert dry_run.expired_snapshots == report.expired_snapshots == 1
+    snapshots = {s.snapshot_id for s in load_table(config, manager).metadata.snapshots}
+    assert tagged in snapshots and len(snapshots) == 2
+    assert row_count(config, manager) == 900
+
+
+def test_rewrite_manifests_leaves_table_properties(loaded):
+    config, readings, manager, maintenance = loaded
+    properties = dict(load_table(config, manager).properties)
+
+    report = maintenance.maintain_table(readings, actions=("rewrite-manifests",))
+    assert report.manifests_before == 3 and report.manifests_after == 1
+    assert dict(load_table(config, manager).properties) == properties
+    assert row_count(config, manager) == 900
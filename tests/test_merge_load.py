@@ -0,0 +1,98 @@
+"""Merge (upsert) loads: changed source rows replace their earlier versions"""
+
+import os
+import sys
+
+import duckdb
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import DuckDBDataSource  # noqa: E402
+from load_data_generic import (  # noqa: E402
+    DatabaseConfig,
+    FieldDefinition,
+    FieldType,
+    GenericDataLoader,
+    IcebergTableManager,
+    TableDefinition,
+)
+
+
+def execute(database_path, *statements):
+    connection = duckdb.connect(database_path)
+    try:
+        for statement in statements:
+            connection.execute(statement)
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def environment(tmp_path):
+    database_path = str(tmp_path / "source.duckdb")
+    execute(
+        database_path,
+        "CREATE SCHEMA meter_data",
+        """CREATE TABLE meter_data.accounts (
+            id INTEGER, status VARCHAR, balance DECIMAL(12, 2), updated_at TIMESTAMP
+        )""",
+        """INSERT INTO meter_data.accounts
+           SELECT range, 'ACTIVE', range * 10, TIMESTAMP '2024-01-01' + range * INTERVAL 1 MINUTE
+           FROM range(1, 101)""",
+    )
+    config = DatabaseConfig(
+        storage_root=str(tmp_path / "lake"),
+        catalog_uri=f"sqlite:///{tmp_path / 'catalog.db'}",
+    )
+    accounts = TableDefinition(
+        name="accounts",
+        fields=[
+            FieldDefinition("id", FieldType.INTEGER, required=True),
+            FieldDefinition("status", FieldType.STRING),
+            FieldDefinition("balance", FieldType.DECIMAL, precision=12, scale=2),
+            FieldDefinition("updated_at", FieldType.TIMESTAMP),
+        ],
+        is_incremental=True,
+        incremental_field="updated_at",
+        primary_key="id",
+        load_mode="merge",
+    )
+    return config, database_path, accounts
+
+
+def load(config, database_path, table_def):
+    source = DuckDBDataSource(config, database_path)
+    result = GenericDataLoader(config, source, [table_def]).load_all_tables()[0]
+    assert result.success, result.error
+    table = IcebergTableManager(config, source)._get_catalog() \
+        .load_table((config.iceberg_namespace, table_def.name))
+    rows = table.scan().to_arrow().sort_by("id").to_pylist()
+    return table, rows
+
+
+def test_merge_updates_and_inserts(environment):
+    config, database_path, accounts = environment
+    _, rows = load(config, database_path, accounts)
+    assert [row["id"] for row in rows] == list(range(1, 101))
+
+    # Update ten accounts and add five new ones
+    execute(
+        database_path,
+        """UPDATE meter_data.accounts
+           SET status = 'CLOSED', balance = 0, updated_at = TIMESTAMP '2024-02-01'
+           WHERE id <= 10""",
+        """INSERT INTO meter_data.accounts
+           SELECT range, 'ACTIVE', 1, TIMESTAMP '2024-02-01'
+           FROM range(101, 106)""",
+    )
+    table, rows = load(config, database_path, accounts)
+    assert [row["id"] for row in rows] == list(range(1, 106))
+    assert {row["id"] for row in rows if row["status"] == "CLOSED"} == set(range(1, 11))
+    assert all(row["balance"] == 0 for row in rows[:10])
+
+    # Nothing changed since: no new snapshot
+    snapshots = len(table.metadata.snapshots)
+    table, rows = load(config, database_path, accounts)
+    assert len(table.metadata.snapshots) == snapshots
+    assert len(rows) == 105
@@ -0,0 +1,111 @@
+"""Watermarks kept in Iceberg snapshot summaries (state backend "iceberg")"""
+
+import os
+import sys
+
+import duckdb
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark import DuckDBDataSource, generate_dimensions, generate_readings  # noqa: E402
+from load_data_generic import (  # noqa: E402
+    DatabaseConfig,
+    GenericDataLoader,
+    IcebergSnapshotStateManager,
+    IcebergTableMaintenance,
+    IcebergTableManager,
+    create_meter_data_definitions,
+)
+
+
+@pytest.fixture
+def environment(tmp_path):
+    database_path = str(tmp_path / "source.duckdb")
+    connection = duckdb.connect(database_path)
+    try:
+        generate_dimensions(connection, 5, 1, 2, seed=1)
+        generate_readings(connection, 1000, seed=1)
+    finally:
+        connection.close()
+
+    config = DatabaseConfig(
+        storage_root=str(tmp_path / "lake"),
+        catalog_uri=f"sqlite:///{tmp_path / 'catalog.db'}",
+        state_backend="iceberg",
+    )
+    readings = next(t for t in create_meter_data_definitions() if t.name == "readings")
+    return config, database_path, readings
+
+
+def run(config, database_path, table_def):
+    source = DuckDBDataSource(config, database_path)
+    result = GenericDataLoader(config, source, [table_def]).load_all_tables()[0]
+    assert result.success, result.error
+    return IcebergTableManager(config, source)
+
+
+def source_readings(database_path, sql):
+    connection = duckdb.connect(database_path, read_only=True)
+    try:
+        return connection.execute(sql).fetchone()[0]
+    finally:
+        connection.close()
+
+
+def add_readings(database_path, count, seed):
+    connection = duckdb.connect(database_path)
+    try:
+        generate_readings(connection, count, seed=seed)
+    finally:
+        connection.close()
+
+
+def loaded_ids(manager, config):
+    table = manager._get_catalog().load_table((config.iceberg_namespace, "readings"))
+    return sorted(table.scan(selected_fields=("id",)).to_arrow().column("id").to_pylist())
+
+
+def test_watermark_round_trip(environment):
+    config, database_path, readings = environment
+    manager = run(config, database_path, readings)
+    state = IcebergSnapshotStateManager(manager)
+    first_end = str(source_readings(database_path, "SELECT max(creation_time) FROM meter_data.readings"))
+
+    # The watermark lives in the table, not in state.json
+    assert not os.path.exists(os.path.join(config.storage_root, "state.json"))
+    assert state.get_last_processed_value("readings", "creation_time")[0] == first_end
+    assert state.get_last_processed_value("customers", "creation_time")[0] is None
+
+    add_readings(database_path, 500, seed=2)
+    manager = run(config, database_path, readings)
+    second_end = str(source_readings(database_path, "SELECT max(creation_time) FROM meter_data.readings"))
+    window = state.get_state()["readings_window"]
+    assert window == {"field": "creation_time", "start": first_end, "end": second_end}
+    assert loaded_ids(manager, config) == list(range(1, 1501))
+
+
+def test_watermark_survives_maintenance(environment):
+    config, database_path, readings = environment
+    for seed in (2, 3):
+        manager = run(config, database_path, readings)
+        add_readings(database_path, 200, seed=seed)
+    manager = run(config, database_path, readings)
+    state = IcebergSnapshotStateManager(manager)
+    watermark = state.get_last_processed_value("readings", "creation_time")[0]
+
+    connection = duckdb.connect()
+    try:
+        report = IcebergTableMaintenance(config, manager, connection).maintain_table(
+            readings, actions=("compact", "rewrite-manifests")
+        )
+    finally:
+        connection.close()
+    assert report.error is None
+    assert report.compacted_input_files > report.compacted_output_files
+    assert state.get_last_processed_value("readings", "creation_time")[0] == watermark
+
+    # The next load starts at the carried watermark
+    add_readings(database_path, 100, seed=4)
+    manager = run(config, database_path, readings)
+    assert loaded_ids(manager, config) == list(range(1, 1501))